@@ -231,7 +231,7 @@ class SystemMetric(Base):
 
 
 # Database session management
-def get_engine(database_url: str = "sqlite:///./womens_health_mcp.db"):
+def get_engine(database_url: str = "sqlite:///./womens_health_mcp.db", poolclass=None):
     """
     Create and return database engine with appropriate configuration.
 
@@ -240,31 +240,38 @@ def get_engine(database_url: str = "sqlite:///./womens_health_mcp.db"):
 
     Args:
         database_url: Database connection URL
+        poolclass: Optional SQLAlchemy pool class (e.g. NullPool for
+            short-lived scripts that only need a single connection)
 
     Returns:
         SQLAlchemy engine instance
     """
+    # Caller-chosen pooling replaces the default QueuePool sizing below
+    engine_kwargs = {"poolclass": poolclass} if poolclass is not None else {}
+
     if database_url.startswith("postgresql"):
         # Production PostgreSQL configuration optimized for Streamlit Cloud
-        return create_engine(
-            database_url,
-            pool_size=2,  # Reduced for Streamlit Cloud's architecture
-            max_overflow=3,  # Smaller overflow for faster connection reuse
-            pool_pre_ping=True,  # Verify connections are alive before using
-            pool_recycle=300,  # Recycle connections every 5 minutes (faster refresh)
-            connect_args={
-                "connect_timeout": 10,  # 10 second connection timeout
-                "options": "-c statement_timeout=30000"  # 30 second query timeout
-            },
-            echo=False,
-        )
+        connect_args = {
+            "connect_timeout": 10,  # 10 second connection timeout
+            "options": "-c statement_timeout=30000"  # 30 second query timeout
+        }
+        if poolclass is None:
+            engine_kwargs.update(
+                pool_size=2,  # Reduced for Streamlit Cloud's architecture
+                max_overflow=3,  # Smaller overflow for faster connection reuse
+                pool_pre_ping=True,  # Verify connections are alive before using
+                pool_recycle=300,  # Recycle connections every 5 minutes (faster refresh)
+            )
     else:
         # Development SQLite configuration
-        return create_engine(
-            database_url,
-            connect_args={"check_same_thread": False},
-            echo=False,  # Set to True for SQL debugging
-        )
+        connect_args = {"check_same_thread": False}
+
+    return create_engine(
+        database_url,
+        connect_args=connect_args,
+        echo=False,  # Set to True for SQL debugging
+        **engine_kwargs,
+    )
 
 
 def get_session_maker(engine):
@@ -272,8 +279,8 @@ def get_session_maker(engine):
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def init_db(database_url: str = "sqlite:///./womens_health_mcp.db"):
+def init_db(database_url: str = "sqlite:///./womens_health_mcp.db", poolclass=None):
     """Initialize database tables."""
-    engine = get_engine(database_url)
+    engine = get_engine(database_url, poolclass=poolclass)
     Base.metadata.create_all(bind=engine)
     return engine
@@ -613,9 +613,11 @@ class MultiServerMCPClient:
                 if status_container:
                     status_container.info(f"🔄 Connecting to {server_name} server...")
 
+                # Run the script itself so its __main__ block installs uvloop
+                # before the server loop starts (`fastmcp run` skips it)
                 server_params = StdioServerParameters(
-                    command="fastmcp",
-                    args=["run", server_path, "--transport", "stdio", "--no-banner"]
+                    command=sys.executable,
+                    args=[server_path]
                 )
 
                 stdio_transport = await self.exit_stack.enter_async_context(
@@ -762,7 +764,7 @@ You are an agent to give scientific answers to women's health questions.
 - **Clinical Calculators**: SART IVF success predictions and recommendations
 
 **IMPORTANT: Use tools efficiently**
-- Make multiple tool calls in parallel when searching different sources
+- Make multiple tool calls in parallel when searching different sources: request the guideline searches (search_eshre_guidelines, search_asrm_guidelines, search_nams_protocols) and search_pubmed together in the same turn - they are executed concurrently - rather than one per turn
 - Always check tool parameters carefully before calling
 - Use the exact tool names and parameters as provided in the tool schemas
 
@@ -862,67 +864,66 @@ Remember: You're providing educational information, not medical advice. Always c
                 })
 
                 # Execute tool calls
-                tool_results = []
-                for content in response.content:
-                    if content.type == 'tool_use':
-                        # Track which tool is being used
-                        tool_calls_made.append(content.name)
-
-                        # Add to tool chain display (without result details yet)
-                        icon = get_tool_icon(content.name)
-                        tool_display_name = content.name.replace('_', ' ').replace('-', ' ').title()
-
-                        # Update tool chain container with current tool
-                        def update_tool_chain():
-                            """Helper to rebuild and update tool chain display."""
-                            if tool_chain_container:
-                                tools_html = ""
-                                for i, tool_name in enumerate(tool_calls_made):
-                                    tool_icon = get_tool_icon(tool_name)
-                                    tool_label = tool_name.replace('_', ' ').replace('-', ' ').title()
-                                    summary = tool_summaries.get(i, "")
-                                    tools_html += f'<div style="display: flex; align-items: center; padding: 8px 0;"><div style="width: 32px; height: 32px; border-radius: 6px; background: #f1f5f9; display: flex; align-items: center; justify-content: center; font-weight: 600; color: #475569; margin-right: 12px; font-size: 14px;">{tool_icon}</div><div style="color: #334155; font-size: 14px;">{tool_label}<span style="color: #64748b; font-size: 12px;">{summary}</span></div></div>'
-
-                                tool_chain_container.markdown(
-                                    f'<div style="background: white; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px; margin: 8px 0;"><div style="color: #64748b; font-size: 13px; margin-bottom: 8px;">{len(tool_calls_made)} step{"s" if len(tool_calls_made) > 1 else ""}</div>{tools_html}</div>',
-                                    unsafe_allow_html=True
-                                )
-
-                        update_tool_chain()
-
-                        # Execute tool via MCP
-                        result = await self.call_tool(
-                            content.name,
-                            content.input
+                tool_uses = [content for content in response.content if content.type == 'tool_use']
+
+                # Update tool chain container with the requested tools
+                def update_tool_chain():
+                    """Helper to rebuild and update tool chain display."""
+                    if tool_chain_container:
+                        tools_html = ""
+                        for i, tool_name in enumerate(tool_calls_made):
+                            tool_icon = get_tool_icon(tool_name)
+                            tool_label = tool_name.replace('_', ' ').replace('-', ' ').title()
+                            summary = tool_summaries.get(i, "")
+                            tools_html += f'<div style="display: flex; align-items: center; padding: 8px 0;"><div style="width: 32px; height: 32px; border-radius: 6px; background: #f1f5f9; display: flex; align-items: center; justify-content: center; font-weight: 600; color: #475569; margin-right: 12px; font-size: 14px;">{tool_icon}</div><div style="color: #334155; font-size: 14px;">{tool_label}<span style="color: #64748b; font-size: 12px;">{summary}</span></div></div>'
+
+                        tool_chain_container.markdown(
+                            f'<div style="background: white; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px; margin: 8px 0;"><div style="color: #64748b; font-size: 13px; margin-bottom: 8px;">{len(tool_calls_made)} step{"s" if len(tool_calls_made) > 1 else ""}</div>{tools_html}</div>',
+                            unsafe_allow_html=True
                         )
 
-                        # Parse result to extract details for display
-                        result_text = result.content[0].text if result.content else ""
-                        result_summary = ""
-
-                        # Extract useful info from result
-                        if 'search_pubmed' in content.name.lower() or 'article' in content.name.lower():
-                            # Try to find result count in response
-                            if 'found' in result_text.lower():
-                                match = re.search(r'found (\d+)', result_text.lower())
-                                if match:
-                                    result_summary = f" • Found {match.group(1)} results"
-                            elif 'retrieved' in result_text.lower():
-                                match = re.search(r'retrieved (\d+)', result_text.lower())
-                                if match:
-                                    result_summary = f" • Retrieved {match.group(1)} articles"
-
-                        # Store the summary for this tool
-                        if result_summary:
-                            tool_summaries[len(tool_calls_made) - 1] = result_summary
-                            # Update display with result details
-                            update_tool_chain()
-
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": content.id,
-                            "content": result.content[0].text
-                        })
+                # Track which tools are being used
+                first_index = len(tool_calls_made)
+                tool_calls_made.extend(content.name for content in tool_uses)
+                update_tool_chain()
+
+                # Execute the tool calls via MCP concurrently - they are independent
+                # requests, often to different servers, so wall time is the slowest call
+                results = await asyncio.gather(*(
+                    self.call_tool(content.name, content.input)
+                    for content in tool_uses
+                ))
+
+                tool_results = []
+                for offset, (content, result) in enumerate(zip(tool_uses, results)):
+                    # Parse result to extract details for display
+                    result_text = result.content[0].text if result.content else ""
+                    result_summary = ""
+
+                    # Extract useful info from result
+                    if 'search_pubmed' in content.name.lower() or 'article' in content.name.lower():
+                        # Try to find result count in response
+                        if 'found' in result_text.lower():
+                            match = re.search(r'found (\d+)', result_text.lower())
+                            if match:
+                                result_summary = f" • Found {match.group(1)} results"
+                        elif 'retrieved' in result_text.lower():
+                            match = re.search(r'retrieved (\d+)', result_text.lower())
+                            if match:
+                                result_summary = f" • Retrieved {match.group(1)} articles"
+
+                    # Store the summary for this tool
+                    if result_summary:
+                        tool_summaries[first_index + offset] = result_summary
+
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": content.id,
+                        "content": result.content[0].text
+                    })
+
+                # Update display with result details
+                update_tool_chain()
 
                 # Add tool results to conversation
                 messages.append({
@@ -10,6 +10,7 @@ Provides access to external medical APIs and clinical guidelines:
 
 import asyncio
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -19,11 +20,39 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from fastmcp import FastMCP
 
 # Import server modules
-sys.path.insert(0, str(Path(__file__).parent.parent / "servers"))
 from servers import pubmed_server, eshre_server, asrm_server, nams_server
+from servers.http_client import close_client, preconnect
+from servers.event_loop import install_uvloop
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm the shared HTTP client on startup and close it on shutdown."""
+    warmup = asyncio.create_task(preconnect(
+        pubmed_server.ESEARCH_URL,
+        eshre_server.GUIDELINES_URL,
+        asrm_server.PRACTICE_GUIDANCE_URL,
+        nams_server.NAMS_BASE_URL,
+    ))
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await close_client()
+
 
 # Create FastMCP server
-mcp = FastMCP("women-health-api")
+mcp = FastMCP("women-health-api", lifespan=lifespan)
+
+# Full guideline pages can run to hundreds of thousands of characters
+MAX_CONTENT_CHARS = 50000
+
+
+def truncate_content(text: str, max_chars: int) -> str:
+    """Cut document text to max_chars, marking where it was truncated."""
+    if max_chars > 0 and len(text) > max_chars:
+        return text[:max_chars] + "\n\n...[truncated]"
+    return text
 
 
 # ==================== PubMed Tools ====================
@@ -45,27 +74,27 @@ async def search_pubmed(query: str, max_results: int = 10) -> str:
 
         # Search PubMed
         search_results = await pubmed_server.search_pubmed(query, max_results)
-        summaries = await pubmed_server.get_article_summaries(search_results["pmids"])
+        summaries = await pubmed_server.summarize_search(search_results)
 
         # Format the response
-        response = f"Found {search_results['count']} articles for query: '{query}'\n\n"
-        response += f"Showing top {len(summaries)} results:\n\n"
+        parts = [f"Found {search_results['count']} articles for query: '{query}'\n\n"]
+        parts.append(f"Showing top {len(summaries)} results:\n\n")
 
         for i, summary in enumerate(summaries, 1):
-            response += f"{i}. **{summary['title']}**\n"
-            response += f"   - PMID: {summary['pmid']}\n"
-            response += f"   - Authors: {', '.join(summary['authors'][:3])}"
+            parts.append(f"{i}. **{summary['title']}**\n")
+            parts.append(f"   - PMID: {summary['pmid']}\n")
+            parts.append(f"   - Authors: {', '.join(summary['authors'][:3])}")
             if len(summary['authors']) > 3:
-                response += f" et al."
-            response += f"\n   - Journal: {summary['journal']}\n"
-            response += f"   - Published: {summary['pubdate']}\n"
+                parts.append(" et al.")
+            parts.append(f"\n   - Journal: {summary['journal']}\n")
+            parts.append(f"   - Published: {summary['pubdate']}\n")
             if summary['doi']:
-                response += f"   - DOI: {summary['doi']}\n"
-            response += "\n"
+                parts.append(f"   - DOI: {summary['doi']}\n")
+            parts.append("\n")
 
-        response += "\nUse the 'get_article' tool with a PMID to retrieve the full abstract and details."
+        parts.append("\nUse the 'get_article' tool with a PMID to retrieve the full abstract and details.")
 
-        return response
+        return "".join(parts)
     except Exception as e:
         return f"Error searching PubMed: {str(e)}\n\nPlease try again or check your query."
 
@@ -83,29 +112,24 @@ async def get_article(pmid: str) -> str:
     """
     try:
         article = await pubmed_server.fetch_article_abstract(pmid)
+        return pubmed_server.format_article(article)
+    except Exception as e:
+        return f"Error retrieving article {pmid}: {str(e)}\n\nPlease verify the PMID is correct."
 
-        # Format the response
-        response = f"# {article['title']}\n\n"
-        response += f"**PMID:** {article['pmid']}\n"
-        if article['doi']:
-            response += f"**DOI:** {article['doi']}\n"
-        response += f"**Journal:** {article['journal']}\n"
-        response += f"**Published:** {article['pubdate']}\n\n"
 
-        if article['authors']:
-            response += f"**Authors:** {', '.join(article['authors'])}\n\n"
+def format_articles(articles: list[dict], failed: list[str]) -> str:
+    """Format fetched PubMed articles as one markdown document."""
+    parts = [f"Retrieved {len(articles)} articles:\n\n"]
+    parts.append("=" * 80 + "\n\n")
 
-        if article['keywords']:
-            response += f"**Keywords:** {', '.join(article['keywords'])}\n\n"
+    for article in articles:
+        parts.append(pubmed_server.format_article(article))
+        parts.append("\n" + "=" * 80 + "\n\n")
 
-        if article['abstract']:
-            response += f"## Abstract\n\n{article['abstract']}\n"
-        else:
-            response += "**Note:** Abstract not available for this article.\n"
+    if failed:
+        parts.append(f"**Note:** Could not retrieve PMIDs: {', '.join(failed)}\n")
 
-        return response
-    except Exception as e:
-        return f"Error retrieving article {pmid}: {str(e)}\n\nPlease verify the PMID is correct."
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -120,38 +144,11 @@ async def get_multiple_articles(pmids: list[str]) -> str:
         pmids: List of PubMed IDs to retrieve
     """
     try:
-        articles = []
-        for pmid in pmids:
-            article = await pubmed_server.fetch_article_abstract(pmid)
-            articles.append(article)
-            await asyncio.sleep(0.34)  # Rate limiting
-
-        # Format the response
-        response = f"Retrieved {len(articles)} articles:\n\n"
-        response += "=" * 80 + "\n\n"
-
-        for article in articles:
-            response += f"# {article['title']}\n\n"
-            response += f"**PMID:** {article['pmid']}\n"
-            if article['doi']:
-                response += f"**DOI:** {article['doi']}\n"
-            response += f"**Journal:** {article['journal']}\n"
-            response += f"**Published:** {article['pubdate']}\n\n"
-
-            if article['authors']:
-                response += f"**Authors:** {', '.join(article['authors'])}\n\n"
-
-            if article['keywords']:
-                response += f"**Keywords:** {', '.join(article['keywords'])}\n\n"
-
-            if article['abstract']:
-                response += f"## Abstract\n\n{article['abstract']}\n"
-            else:
-                response += "**Note:** Abstract not available for this article.\n"
-
-            response += "\n" + "=" * 80 + "\n\n"
+        # One EFetch request per 200 PMIDs rather than one per article
+        articles, failed = await pubmed_server.fetch_multiple_articles(pmids)
 
-        return response
+        # Formatting dozens of abstracts is CPU work; keep it off the event loop
+        return await asyncio.to_thread(format_articles, articles, failed)
     except Exception as e:
         return f"Error retrieving articles: {str(e)}\n\nPlease verify the PMIDs are correct."
 
@@ -168,16 +165,16 @@ async def list_eshre_guidelines() -> str:
     """
     guidelines = await eshre_server.parse_guidelines_list()
 
-    result = "# ESHRE Clinical Guidelines\n\n"
-    result += f"Found {len(guidelines)} clinical guidelines:\n\n"
+    parts = ["# ESHRE Clinical Guidelines\n\n"]
+    parts.append(f"Found {len(guidelines)} clinical guidelines:\n\n")
 
     for i, guideline in enumerate(guidelines, 1):
-        result += f"{i}. **{guideline['title']}**\n"
+        parts.append(f"{i}. **{guideline['title']}**\n")
         if guideline['description']:
-            result += f"   {guideline['description']}\n"
-        result += f"   URL: {guideline['url']}\n\n"
+            parts.append(f"   {guideline['description']}\n")
+        parts.append(f"   URL: {guideline['url']}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -190,48 +187,49 @@ async def search_eshre_guidelines(query: str) -> str:
     """
     results = await eshre_server.search_guidelines(query)
 
-    result = f"# Search Results for '{query}'\n\n"
-    result += f"Found {len(results)} matching guidelines:\n\n"
+    parts = [f"# Search Results for '{query}'\n\n"]
+    parts.append(f"Found {len(results)} matching guidelines:\n\n")
 
     for i, guideline in enumerate(results, 1):
-        result += f"{i}. **{guideline['title']}**\n"
+        parts.append(f"{i}. **{guideline['title']}**\n")
         if guideline['description']:
-            result += f"   {guideline['description']}\n"
-        result += f"   URL: {guideline['url']}\n\n"
+            parts.append(f"   {guideline['description']}\n")
+        parts.append(f"   URL: {guideline['url']}\n\n")
 
     if not results:
-        result += "No guidelines found matching your query.\n"
-        result += "Try different keywords or browse all guidelines using list_eshre_guidelines.\n"
+        parts.append("No guidelines found matching your query.\n")
+        parts.append("Try different keywords or browse all guidelines using list_eshre_guidelines.\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
-async def get_eshre_guideline(url: str) -> str:
+async def get_eshre_guideline(url: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
     """
     Retrieve the full content and download links for a specific ESHRE guideline.
     
     Args:
         url: Full URL of the guideline document
+        max_chars: Maximum characters of guideline text to return (default: 50000, 0 for no limit)
     """
     content = await eshre_server.get_guideline_content(url)
 
-    result = f"# {content['title']}\n\n"
-    result += f"**URL:** {content['url']}\n"
+    parts = [f"# {content['title']}\n\n"]
+    parts.append(f"**URL:** {content['url']}\n")
     if content['date']:
-        result += f"**Published:** {content['date']}\n"
-    result += f"**Word Count:** {content['word_count']}\n\n"
+        parts.append(f"**Published:** {content['date']}\n")
+    parts.append(f"**Word Count:** {content['word_count']}\n\n")
 
     if content['downloads']:
-        result += "## Downloads\n\n"
+        parts.append("## Downloads\n\n")
         for dl in content['downloads']:
-            result += f"- [{dl['title']}]({dl['url']})\n"
-        result += "\n"
+            parts.append(f"- [{dl['title']}]({dl['url']})\n")
+        parts.append("\n")
 
-    result += "---\n\n"
-    result += content['content']
+    parts.append("---\n\n")
+    parts.append(truncate_content(content['content'], max_chars))
 
-    return result
+    return "".join(parts)
 
 
 # ==================== ASRM Guidelines Tools ====================
@@ -246,19 +244,19 @@ async def list_asrm_practice_documents() -> str:
     """
     documents = await asrm_server.parse_practice_documents()
 
-    result = "# ASRM Practice Documents\n\n"
-    result += f"Found {len(documents)} practice documents:\n\n"
+    parts = ["# ASRM Practice Documents\n\n"]
+    parts.append(f"Found {len(documents)} practice documents:\n\n")
 
     for i, doc in enumerate(documents[:15], 1):  # Limit for readability
-        result += f"{i}. **{doc['title']}**\n"
+        parts.append(f"{i}. **{doc['title']}**\n")
         if doc['description']:
-            result += f"   {doc['description']}\n"
-        result += f"   URL: {doc['url']}\n\n"
+            parts.append(f"   {doc['description']}\n")
+        parts.append(f"   URL: {doc['url']}\n\n")
 
     if len(documents) > 15:
-        result += f"\n...and {len(documents) - 15} more documents.\n"
+        parts.append(f"\n...and {len(documents) - 15} more documents.\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -271,19 +269,19 @@ async def list_asrm_ethics_opinions() -> str:
     """
     opinions = await asrm_server.parse_ethics_opinions()
 
-    result = "# ASRM Ethics Opinions\n\n"
-    result += f"Found {len(opinions)} ethics opinions:\n\n"
+    parts = ["# ASRM Ethics Opinions\n\n"]
+    parts.append(f"Found {len(opinions)} ethics opinions:\n\n")
 
     for i, op in enumerate(opinions[:15], 1):
-        result += f"{i}. **{op['title']}**\n"
+        parts.append(f"{i}. **{op['title']}**\n")
         if op['description']:
-            result += f"   {op['description']}\n"
-        result += f"   URL: {op['url']}\n\n"
+            parts.append(f"   {op['description']}\n")
+        parts.append(f"   URL: {op['url']}\n\n")
 
     if len(opinions) > 15:
-        result += f"\n...and {len(opinions) - 15} more opinions.\n"
+        parts.append(f"\n...and {len(opinions) - 15} more opinions.\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -297,25 +295,25 @@ async def search_asrm_guidelines(query: str, category: Optional[str] = None) ->
     """
     results = await asrm_server.search_guidelines(query, category)
 
-    result = f"# Search Results for '{query}'\n\n"
+    parts = [f"# Search Results for '{query}'\n\n"]
 
     if category:
-        result += f"Category: {category}\n\n"
+        parts.append(f"Category: {category}\n\n")
 
-    result += f"Found {len(results)} matching documents:\n\n"
+    parts.append(f"Found {len(results)} matching documents:\n\n")
 
     for i, doc in enumerate(results, 1):
-        result += f"{i}. **{doc['title']}**\n"
-        result += f"   Type: {doc['type']}\n"
+        parts.append(f"{i}. **{doc['title']}**\n")
+        parts.append(f"   Type: {doc['type']}\n")
         if doc['description']:
-            result += f"   {doc['description']}\n"
-        result += f"   URL: {doc['url']}\n\n"
+            parts.append(f"   {doc['description']}\n")
+        parts.append(f"   URL: {doc['url']}\n\n")
 
     if not results:
-        result += "No documents found matching your query.\n"
-        result += "Try different keywords or browse all documents using list_asrm_practice_documents or list_asrm_ethics_opinions.\n"
+        parts.append("No documents found matching your query.\n")
+        parts.append("Try different keywords or browse all documents using list_asrm_practice_documents or list_asrm_ethics_opinions.\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -328,15 +326,15 @@ async def get_asrm_guideline(url: str) -> str:
     """
     content = await asrm_server.get_guideline_content(url)
 
-    result = f"# {content['title']}\n\n"
-    result += f"**URL:** {content['url']}\n"
+    parts = [f"# {content['title']}\n\n"]
+    parts.append(f"**URL:** {content['url']}\n")
     if content['date']:
-        result += f"**Date:** {content['date']}\n"
-    result += f"**Word Count:** {content['word_count']}\n\n"
-    result += "---\n\n"
-    result += content['content']
+        parts.append(f"**Date:** {content['date']}\n")
+    parts.append(f"**Word Count:** {content['word_count']}\n\n")
+    parts.append("---\n\n")
+    parts.append(content['content'])
 
-    return result
+    return "".join(parts)
 
 
 # ==================== NAMS Position Statements Tools ====================
@@ -349,7 +347,7 @@ async def list_nams_position_statements() -> str:
     NAMS (The Menopause Society, formerly North American Menopause Society) provides
     evidence-based menopause management guidelines and hormone therapy recommendations.
     """
-    statements = await nams_server.parse_position_statements()
+    statements = list(await nams_server.parse_position_statements())
 
     # Supplement with known statements if needed
     if len(statements) < 5:
@@ -359,19 +357,19 @@ async def list_nams_position_statements() -> str:
             if stmt['url'] not in seen_urls:
                 statements.append(stmt)
 
-    result = "# NAMS Position Statements & Clinical Guidelines\n\n"
-    result += f"Found {len(statements)} position statements and guidelines:\n\n"
+    parts = ["# NAMS Position Statements & Clinical Guidelines\n\n"]
+    parts.append(f"Found {len(statements)} position statements and guidelines:\n\n")
 
     for i, stmt in enumerate(statements, 1):
-        result += f"{i}. **{stmt['title']}**\n"
+        parts.append(f"{i}. **{stmt['title']}**\n")
         if stmt.get('topic'):
-            result += f"   Topic: {stmt['topic']}\n"
+            parts.append(f"   Topic: {stmt['topic']}\n")
         if stmt.get('description'):
-            result += f"   {stmt['description']}\n"
-        result += f"   Type: {stmt['type']}\n"
-        result += f"   URL: {stmt['url']}\n\n"
+            parts.append(f"   {stmt['description']}\n")
+        parts.append(f"   Type: {stmt['type']}\n")
+        parts.append(f"   URL: {stmt['url']}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -385,51 +383,52 @@ async def search_nams_protocols(query: str, topic: Optional[str] = None) -> str:
     """
     results = await nams_server.search_protocols(query, topic)
 
-    result = f"# Search Results for '{query}'\n\n"
+    parts = [f"# Search Results for '{query}'\n\n"]
 
     if topic:
-        result += f"Topic filter: {topic}\n\n"
+        parts.append(f"Topic filter: {topic}\n\n")
 
-    result += f"Found {len(results)} matching documents:\n\n"
+    parts.append(f"Found {len(results)} matching documents:\n\n")
 
     for i, doc in enumerate(results, 1):
-        result += f"{i}. **{doc['title']}**\n"
-        result += f"   Type: {doc['type']}\n"
+        parts.append(f"{i}. **{doc['title']}**\n")
+        parts.append(f"   Type: {doc['type']}\n")
         if doc.get('topic'):
-            result += f"   Topic: {doc['topic']}\n"
+            parts.append(f"   Topic: {doc['topic']}\n")
         if doc.get('description'):
-            result += f"   {doc['description']}\n"
-        result += f"   URL: {doc['url']}\n\n"
+            parts.append(f"   {doc['description']}\n")
+        parts.append(f"   URL: {doc['url']}\n\n")
 
     if not results:
-        result += "No documents found matching your query.\n"
-        result += "Try different keywords or browse all documents using list_nams_position_statements.\n"
-        result += "\nCommon topics: hormone therapy, vasomotor symptoms, osteoporosis, cardiovascular, genitourinary\n"
+        parts.append("No documents found matching your query.\n")
+        parts.append("Try different keywords or browse all documents using list_nams_position_statements.\n")
+        parts.append("\nCommon topics: hormone therapy, vasomotor symptoms, osteoporosis, cardiovascular, genitourinary\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
-async def get_nams_protocol(url: str) -> str:
+async def get_nams_protocol(url: str, max_chars: int = MAX_CONTENT_CHARS) -> str:
     """
     Retrieve the full content of a specific NAMS protocol or position statement.
     
     Args:
         url: Full URL of the protocol or position statement
+        max_chars: Maximum characters of document text to return (default: 50000, 0 for no limit)
     """
     content = await nams_server.get_protocol_content(url)
 
-    result = f"# {content['title']}\n\n"
-    result += f"**URL:** {content['url']}\n"
-    result += f"**Content Type:** {content['content_type']}\n"
+    parts = [f"# {content['title']}\n\n"]
+    parts.append(f"**URL:** {content['url']}\n")
+    parts.append(f"**Content Type:** {content['content_type']}\n")
     if content.get('date'):
-        result += f"**Date:** {content['date']}\n"
+        parts.append(f"**Date:** {content['date']}\n")
     if content['word_count'] > 0:
-        result += f"**Word Count:** {content['word_count']}\n"
-    result += "\n---\n\n"
-    result += content['content']
+        parts.append(f"**Word Count:** {content['word_count']}\n")
+    parts.append("\n---\n\n")
+    parts.append(truncate_content(content['content'], max_chars))
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -456,15 +455,15 @@ async def list_nams_topics() -> str:
         "Complementary and Alternative Medicine"
     ]
 
-    result = "# Common Topics in NAMS Position Statements\n\n"
-    result += "The following topics are commonly addressed in NAMS position statements:\n\n"
+    parts = ["# Common Topics in NAMS Position Statements\n\n"]
+    parts.append("The following topics are commonly addressed in NAMS position statements:\n\n")
 
     for i, topic in enumerate(topics, 1):
-        result += f"{i}. {topic}\n"
+        parts.append(f"{i}. {topic}\n")
 
-    result += "\nUse these topics to search for specific position statements with the search_nams_protocols tool.\n"
+    parts.append("\nUse these topics to search for specific position statements with the search_nams_protocols tool.\n")
 
-    return result
+    return "".join(parts)
 
 
 # Environment variables for API connections
@@ -479,4 +478,5 @@ NAMS_TOKEN = os.getenv("NAMS_TOKEN", "")
 
 # Run the server
 if __name__ == "__main__":
+    install_uvloop()
     mcp.run()
\ No newline at end of file
@@ -8,9 +8,10 @@ Provides clinical calculation tools for reproductive medicine:
 
 import asyncio
 import sys
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional
-import json
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -18,11 +19,72 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from fastmcp import FastMCP
 
 # Import SART IVF server module
-sys.path.insert(0, str(Path(__file__).parent.parent / "servers"))
 from servers import sart_ivf_server
+from servers.http_client import close_client, preconnect
+from servers.event_loop import install_uvloop
+from servers.serialization import dumps
+
+
+# Height assumed when only BMI is supplied to predict_ivf_success
+ASSUMED_HEIGHT_M = 1.65
+
+# Accepted (min, max) for each PatientInput measurement, matching the
+# ranges documented on the calculator tools. AMH has no documented range
+# (PCOS patients can be well above 20 ng/mL), so it is not bounded here.
+PATIENT_BOUNDS = {
+    "age": (18, 45),
+    "height_cm": (120, 220),
+    "weight_kg": (30, 160),
+    "height_ft": (4, 7),
+    "height_in": (0, 11),
+    "weight_lbs": (70, 350),
+}
+
+
+@dataclass(slots=True)
+class PatientInput:
+    """Patient parameters for sart_ivf_server.calculate_ivf_success."""
+    age: int
+    amh_value: float
+    amh_available: bool = True
+    previous_full_term: bool = False
+    male_factor: bool = False
+    polycystic: bool = False
+    uterine_problems: bool = False
+    unexplained_infertility: bool = False
+    low_ovarian_reserve: bool = False
+    height_cm: Optional[float] = None
+    weight_kg: Optional[float] = None
+    height_ft: Optional[int] = None
+    height_in: Optional[int] = None
+    weight_lbs: Optional[float] = None
+
+    def __post_init__(self):
+        """Reject values outside PATIENT_BOUNDS."""
+        for name, (low, high) in PATIENT_BOUNDS.items():
+            value = getattr(self, name)
+            if value is not None and not low <= value <= high:
+                raise ValueError(f"{name} must be between {low} and {high}, got {value}")
+
+    def to_params(self) -> dict:
+        """Keyword arguments for the SART calculator, leaving out unset measurements."""
+        params = {f.name: getattr(self, f.name) for f in fields(self)}
+        return {name: value for name, value in params.items() if value is not None}
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm the shared HTTP client on startup and close it on shutdown."""
+    warmup = asyncio.create_task(preconnect(sart_ivf_server.SART_URL))
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await close_client()
+
 
 # Create FastMCP server
-mcp = FastMCP("women-health-calculator")
+mcp = FastMCP("women-health-calculator", lifespan=lifespan)
 
 
 @mcp.tool()
@@ -65,32 +127,30 @@ async def calculate_ivf_success(
         amh_available: Is AMH (Anti-Müllerian Hormone) level known?
         amh_value: AMH level in ng/ml (only if amh_available is true)
     """
-    # Validate age range
-    if age < 18 or age > 45:
-        return json.dumps({
-            "error": "Age must be between 18 and 45 years",
-            "provided_age": age
-        }, indent=2)
+    try:
+        patient = PatientInput(
+            age=age,
+            amh_value=amh_value,
+            amh_available=amh_available,
+            previous_full_term=previous_full_term,
+            male_factor=male_factor,
+            polycystic=polycystic,
+            uterine_problems=uterine_problems,
+            unexplained_infertility=unexplained_infertility,
+            low_ovarian_reserve=low_ovarian_reserve,
+            height_cm=height_cm,
+            weight_kg=weight_kg,
+            height_ft=height_ft,
+            height_in=height_in,
+            weight_lbs=weight_lbs,
+        )
+    except ValueError as e:
+        return dumps({"error": str(e)})
 
     # Call SART server calculation
-    result = await sart_ivf_server.calculate_ivf_success(
-        age=age,
-        height_cm=height_cm,
-        weight_kg=weight_kg,
-        height_ft=height_ft,
-        height_in=height_in,
-        weight_lbs=weight_lbs,
-        previous_full_term=previous_full_term,
-        male_factor=male_factor,
-        polycystic=polycystic,
-        uterine_problems=uterine_problems,
-        unexplained_infertility=unexplained_infertility,
-        low_ovarian_reserve=low_ovarian_reserve,
-        amh_available=amh_available,
-        amh_value=amh_value
-    )
-
-    return json.dumps(result, indent=2)
+    result = await sart_ivf_server.calculate_ivf_success(**patient.to_params())
+
+    return dumps(result)
 
 
 @mcp.tool()
@@ -131,39 +191,33 @@ async def predict_ivf_success(
         uterine_problems: Does patient have uterine problems?
         unexplained_infertility: Diagnosed with unexplained infertility?
         low_ovarian_reserve: Diagnosed with low ovarian reserve?
-        bmi: Body Mass Index (optional, for internal calculations)
+        bmi: Body Mass Index (optional). Without a weight, it is converted to
+            weight_kg at a 1.65 m height, which must fall in the 30-160 kg range
     """
-    # Build parameters for SART calculator
-    calc_params = {
-        "age": age,
-        "amh_available": True,
-        "amh_value": amh,
-        "previous_full_term": prior_pregnancies > 0,
-        "male_factor": male_factor,
-        "polycystic": polycystic,
-        "uterine_problems": uterine_problems,
-        "unexplained_infertility": unexplained_infertility,
-        "low_ovarian_reserve": low_ovarian_reserve,
-    }
-
-    # Add height/weight if provided
-    if height_cm:
-        calc_params["height_cm"] = height_cm
-    if weight_kg:
-        calc_params["weight_kg"] = weight_kg
-    if height_ft:
-        calc_params["height_ft"] = height_ft
-    if height_in:
-        calc_params["height_in"] = height_in
-    if weight_lbs:
-        calc_params["weight_lbs"] = weight_lbs
-
-    # Calculate BMI-based weight if only BMI provided
+    # Only BMI given: derive a weight assuming average height
     if bmi and not weight_kg and not weight_lbs:
-        height_m = 1.65  # Assume average height
-        calc_params["weight_kg"] = bmi * (height_m ** 2)
+        weight_kg = bmi * (ASSUMED_HEIGHT_M ** 2)
+
+    try:
+        patient = PatientInput(
+            age=age,
+            amh_value=amh,
+            previous_full_term=prior_pregnancies > 0,
+            male_factor=male_factor,
+            polycystic=polycystic,
+            uterine_problems=uterine_problems,
+            unexplained_infertility=unexplained_infertility,
+            low_ovarian_reserve=low_ovarian_reserve,
+            height_cm=height_cm or None,
+            weight_kg=weight_kg or None,
+            height_ft=height_ft or None,
+            height_in=height_in or None,
+            weight_lbs=weight_lbs or None,
+        )
+    except ValueError as e:
+        return dumps({"error": str(e)})
 
-    result = await sart_ivf_server.calculate_ivf_success(**calc_params)
+    result = await sart_ivf_server.calculate_ivf_success(**patient.to_params())
 
     # Format response with enhanced presentation
     response = {
@@ -194,7 +248,7 @@ async def predict_ivf_success(
         "data_source": "SART IVF Calculator API (University of Aberdeen)",
     }
 
-    return json.dumps(response, indent=2)
+    return dumps(response)
 
 
 @mcp.tool()
@@ -226,7 +280,7 @@ async def generate_recommendations(calculation_result: dict) -> str:
         "important_note": "These recommendations are for informational purposes. Always consult with a qualified fertility specialist for personalized medical advice."
     }
     
-    return json.dumps(formatted_response, indent=2)
+    return dumps(formatted_response)
 
 
 @mcp.tool()
@@ -279,7 +333,7 @@ async def get_sart_calculator_info() -> str:
         "disclaimer": "For informational purposes only. Clinical decisions should always be made in consultation with qualified fertility specialists."
     }
     
-    return json.dumps(info, indent=2)
+    return dumps(info)
 
 
 @mcp.tool()
@@ -295,10 +349,10 @@ async def compare_success_rates(scenarios: list[dict]) -> str:
                   for calculate_ivf_success function
     """
     if not scenarios:
-        return json.dumps({"error": "No scenarios provided for comparison"}, indent=2)
+        return dumps({"error": "No scenarios provided for comparison"})
     
     if len(scenarios) > 5:
-        return json.dumps({"error": "Maximum 5 scenarios allowed for comparison"}, indent=2)
+        return dumps({"error": "Maximum 5 scenarios allowed for comparison"})
     
     results = []
     
@@ -348,9 +402,10 @@ async def compare_success_rates(scenarios: list[dict]) -> str:
         "interpretation": "Compare success rates to understand impact of different patient factors on IVF outcomes"
     }
     
-    return json.dumps(comparison, indent=2)
+    return dumps(comparison)
 
 
 # Run the server
 if __name__ == "__main__":
+    install_uvloop()
     mcp.run()
\ No newline at end of file
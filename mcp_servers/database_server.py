@@ -4,7 +4,6 @@ Women's Health Database Server - FastMCP Implementation
 Provides access to ELSA (English Longitudinal Study of Ageing) datasets and metadata
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Optional
@@ -13,16 +12,21 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fastmcp import FastMCP
-import json
 
 # Import ELSA server module
-sys.path.insert(0, str(Path(__file__).parent.parent / "servers"))
 from servers import elsa_server
+from servers.serialization import dumps
+from servers.event_loop import install_uvloop
 
 # Create FastMCP server
 mcp = FastMCP("women-health-database")
 
 
+# The wave table is static, so both listings are serialized once at import
+_ELSA_WAVES_BRIEF_JSON = dumps(elsa_server.build_wave_listing(False))
+_ELSA_WAVES_DETAIL_JSON = dumps(elsa_server.build_wave_listing(True))
+
+
 @mcp.tool()
 async def list_elsa_waves(include_details: bool = False) -> str:
     """
@@ -35,28 +39,7 @@ async def list_elsa_waves(include_details: bool = False) -> str:
     Args:
         include_details: Include detailed information about each wave
     """
-    if include_details:
-        result = {
-            "study": elsa_server.ELSA_FULL_NAME,
-            "study_number": elsa_server.ELSA_STUDY_NUMBER,
-            "total_waves": len(elsa_server.ELSA_WAVES),
-            "waves": elsa_server.ELSA_WAVES
-        }
-    else:
-        result = {
-            "study": elsa_server.ELSA_FULL_NAME,
-            "total_waves": len(elsa_server.ELSA_WAVES),
-            "waves": [
-                {
-                    "wave": v["wave"],
-                    "name": v["name"],
-                    "year": v["year"]
-                }
-                for v in elsa_server.ELSA_WAVES.values()
-            ]
-        }
-
-    return json.dumps(result, indent=2)
+    return _ELSA_WAVES_DETAIL_JSON if include_details else _ELSA_WAVES_BRIEF_JSON
 
 
 @mcp.tool()
@@ -71,15 +54,15 @@ async def get_wave_details(wave: str) -> str:
         wave = "11"
 
     if wave not in elsa_server.ELSA_WAVES:
-        return json.dumps({
+        return dumps({
             "error": f"Wave {wave} not found. Available waves: 0-11"
-        }, indent=2)
+        })
 
     wave_info = elsa_server.ELSA_WAVES[wave].copy()
     wave_info["ukds_url"] = f"{elsa_server.UKDS_BASE_URL}/datacatalogue/studies/study?id={elsa_server.ELSA_STUDY_NUMBER}"
     wave_info["project_url"] = f"{elsa_server.ELSA_PROJECT_URL}/data-and-documentation"
 
-    return json.dumps(wave_info, indent=2)
+    return dumps(wave_info)
 
 
 @mcp.tool()
@@ -92,31 +75,16 @@ async def search_data_modules(query: str, module: Optional[str] = None) -> str:
     work/retirement, social networks, family relationships, and health behaviors.
     
     Args:
-        query: Search term (e.g., 'cognitive', 'depression', 'wealth', 'menopause')
+        query: Search term(s); a module matches if any term appears (e.g., 'cognitive', 'depression wealth')
         module: Specific module to search (optional)
     """
-    query_lower = query.lower()
-    results = []
-
-    modules_to_search = {module: elsa_server.ELSA_DATA_MODULES[module]} if module else elsa_server.ELSA_DATA_MODULES
-
-    for mod_id, mod_data in modules_to_search.items():
-        # Search in name, description, and variables
-        searchable_text = f"{mod_data['name']} {mod_data['description']} {' '.join(mod_data['variables'])}".lower()
-
-        if query_lower in searchable_text:
-            results.append({
-                "module_id": mod_id,
-                "module_name": mod_data["name"],
-                "description": mod_data["description"],
-                "relevant_variables": [v for v in mod_data["variables"] if query_lower in v.lower()]
-            })
+    results = elsa_server.search_modules(query.lower(), module)
 
-    return json.dumps({
+    return dumps({
         "query": query,
         "results_found": len(results),
         "modules": results
-    }, indent=2)
+    })
 
 
 @mcp.tool()
@@ -131,14 +99,14 @@ async def get_data_module_info(module: str) -> str:
         module: Module identifier
     """
     if module not in elsa_server.ELSA_DATA_MODULES:
-        return json.dumps({
+        return dumps({
             "error": f"Module '{module}' not found. Available modules: {list(elsa_server.ELSA_DATA_MODULES.keys())}"
-        }, indent=2)
+        })
 
     module_info = elsa_server.ELSA_DATA_MODULES[module].copy()
     module_info["module_id"] = module
 
-    return json.dumps(module_info, indent=2)
+    return dumps(module_info)
 
 
 @mcp.tool()
@@ -218,7 +186,7 @@ async def get_access_information(detailed: bool = True) -> str:
             "url": "https://ukdataservice.ac.uk/help/secure-lab/"
         }
 
-    return json.dumps(access_info, indent=2)
+    return dumps(access_info)
 
 
 @mcp.tool()
@@ -258,7 +226,7 @@ async def get_study_metadata() -> str:
         "ukds_url": f"{elsa_server.UKDS_BASE_URL}/datacatalogue/studies/study?id={elsa_server.ELSA_STUDY_NUMBER}"
     }
 
-    return json.dumps(metadata, indent=2)
+    return dumps(metadata)
 
 
 @mcp.tool()
@@ -299,7 +267,7 @@ async def get_documentation_links(wave: Optional[str] = None, doc_type: str = "a
         result["wave"] = wave
         result["note"] = f"Wave {wave} specific documentation available via UKDS after registration"
 
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 @mcp.tool()
@@ -312,7 +280,7 @@ async def compare_waves(waves: list[str], focus: str = "all") -> str:
         focus: Specific aspect to focus comparison on (topics, sample_size, all)
     """
     if not waves:
-        return json.dumps({"error": "No waves specified for comparison"}, indent=2)
+        return dumps({"error": "No waves specified for comparison"})
 
     comparison = {
         "waves_compared": waves,
@@ -339,7 +307,7 @@ async def compare_waves(waves: list[str], focus: str = "all") -> str:
             comparison["comparison"][wave]["sample_size"] = wave_data["sample_size"]
             comparison["comparison"][wave]["fieldwork_period"] = wave_data["fieldwork_period"]
 
-    return json.dumps(comparison, indent=2)
+    return dumps(comparison)
 
 
 @mcp.tool()
@@ -407,9 +375,10 @@ async def get_research_examples(topic: str = "general") -> str:
         ]
     }
 
-    return json.dumps(result, indent=2)
+    return dumps(result)
 
 
 # Run the server
 if __name__ == "__main__":
+    install_uvloop()
     mcp.run()
\ No newline at end of file
@@ -7,6 +7,7 @@ Usage: python -m scripts.create_admin
 
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import NullPool
 from database.models import init_db, get_session_maker, User
 
 # Load environment variables
@@ -27,31 +28,45 @@ def promote_users_to_admin():
     print("Admin User Promotion Script")
     print("=" * 60)
 
-    # Initialize database
-    engine = init_db(DATABASE_URL)
+    # Initialize database (one-shot script, so no connection pool)
+    engine = init_db(DATABASE_URL, poolclass=NullPool)
     SessionLocal = get_session_maker(engine)
     db = SessionLocal()
 
     try:
-        promoted_count = 0
+        # One SELECT for every listed email instead of a query per address
+        existing = {
+            user.email: user
+            for user in db.query(User).filter(User.email.in_(ADMIN_EMAILS)).all()
+        }
+
+        to_promote = []
         not_found = []
 
-        for email in ADMIN_EMAILS:
-            # Find user by email
-            user = db.query(User).filter(User.email == email).first()
+        # dict.fromkeys drops repeated addresses but keeps the listed order
+        for email in dict.fromkeys(ADMIN_EMAILS):
+            user = existing.get(email)
 
             if user:
                 if user.is_admin:
                     print(f"✓ {email} - Already admin")
                 else:
-                    user.is_admin = True
-                    db.commit()
-                    promoted_count += 1
-                    print(f"✅ {email} - Promoted to admin")
+                    to_promote.append(email)
             else:
                 not_found.append(email)
                 print(f"⚠️  {email} - User not found (needs to sign up first)")
 
+        # Promote everyone in a single UPDATE and commit once
+        if to_promote:
+            db.query(User).filter(User.email.in_(to_promote)).update(
+                {User.is_admin: True}, synchronize_session=False
+            )
+            db.commit()
+            for email in to_promote:
+                print(f"✅ {email} - Promoted to admin")
+
+        promoted_count = len(to_promote)
+
         print("\n" + "=" * 60)
         print(f"Summary:")
         print(f"  - Promoted: {promoted_count}")
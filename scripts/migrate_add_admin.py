@@ -8,8 +8,9 @@ Usage: python -m scripts.migrate_add_admin
 import os
 from dotenv import load_dotenv
 from sqlalchemy import text
+from sqlalchemy.pool import NullPool
 
-from database.models import init_db, get_session_maker
+from database.models import init_db
 
 # Load environment variables
 load_dotenv()
@@ -22,40 +23,30 @@ def add_admin_column():
     print("Database Migration: Add is_admin Column")
     print("=" * 60)
 
-    engine = init_db(DATABASE_URL)
-    SessionLocal = get_session_maker(engine)
-    db = SessionLocal()
+    # One-shot script, so no connection pool
+    engine = init_db(DATABASE_URL, poolclass=NullPool)
 
     try:
-        # Check if column exists
-        if DATABASE_URL.startswith("sqlite"):
-            # SQLite check
-            result = db.execute(text("PRAGMA table_info(users)"))
-            columns = [row[1] for row in result]
-
-            if 'is_admin' in columns:
-                print("✓ is_admin column already exists")
-            else:
-                print("Adding is_admin column to users table...")
-                db.execute(text("ALTER TABLE users ADD COLUMN is_admin BOOLEAN DEFAULT 0 NOT NULL"))
-                db.commit()
-                print("✅ is_admin column added successfully")
-
-        elif DATABASE_URL.startswith("postgresql"):
-            # PostgreSQL check
-            result = db.execute(text("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name='users' AND column_name='is_admin'
-            """))
-
-            if result.fetchone():
-                print("✓ is_admin column already exists")
-            else:
-                print("Adding is_admin column to users table...")
-                db.execute(text("ALTER TABLE users ADD COLUMN is_admin BOOLEAN DEFAULT FALSE NOT NULL"))
-                db.commit()
-                print("✅ is_admin column added successfully")
+        # engine.begin() commits on exit and rolls back if anything raises
+        with engine.begin() as conn:
+            if DATABASE_URL.startswith("sqlite"):
+                # SQLite has no ADD COLUMN IF NOT EXISTS; look up just this column
+                result = conn.execute(text(
+                    "SELECT 1 FROM pragma_table_info('users') WHERE name = 'is_admin'"
+                ))
+
+                if result.first():
+                    print("✓ is_admin column already exists")
+                else:
+                    print("Adding is_admin column to users table...")
+                    conn.execute(text("ALTER TABLE users ADD COLUMN is_admin BOOLEAN DEFAULT 0 NOT NULL"))
+                    print("✅ is_admin column added successfully")
+
+            elif DATABASE_URL.startswith("postgresql"):
+                # PostgreSQL skips existing columns itself, so no separate lookup
+                print("Adding is_admin column to users table if missing...")
+                conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS is_admin BOOLEAN DEFAULT FALSE NOT NULL"))
+                print("✅ is_admin column is present")
 
         print("=" * 60)
         print("Migration completed successfully!")
@@ -63,9 +54,8 @@ def add_admin_column():
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        db.rollback()
     finally:
-        db.close()
+        engine.dispose()
 
 
 if __name__ == "__main__":
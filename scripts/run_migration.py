@@ -24,9 +24,10 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./womens_health_mcp.db")
 
 def check_column_exists(engine, table_name: str, column_name: str) -> bool:
     """Check if a column exists in a table."""
+    # Not cached across calls: an Inspector memoises reflection results, so a
+    # shared one would still report the column missing after it is added
     inspector = inspect(engine)
-    columns = [col['name'] for col in inspector.get_columns(table_name)]
-    return column_name in columns
+    return any(col['name'] == column_name for col in inspector.get_columns(table_name))
 
 
 def add_admin_column():
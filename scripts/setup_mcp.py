@@ -4,6 +4,7 @@ Setup script for DoctHER - Women's Health AI Assistant
 Prepares your environment to run the application
 """
 
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -87,10 +88,11 @@ def verify_installation():
 
     all_good = True
     for package, name in required_packages:
-        try:
-            __import__(package)
+        # Locate the package without importing it; importing fastmcp or
+        # streamlit just to see whether it is there takes a second or more
+        if importlib.util.find_spec(package) is not None:
             print(f"   ✓ {name}")
-        except ImportError:
+        else:
             print(f"   ❌ {name} - not installed")
             all_good = False
 
@@ -7,23 +7,40 @@ Reproductive Medicine) practice guidance documents, committee opinions, ethics
 opinions, and other clinical resources.
 """
 
-import os
 import asyncio
+import sys
+from pathlib import Path
 from typing import Any, Optional
 import httpx
-from bs4 import BeautifulSoup
 import re
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.cache import async_lru_cache
+from servers.event_loop import install_uvloop
+from servers.http_client import get_client, close_client, preconnect
+from servers.scraping import parse_html
+from servers.validation import compile_validators, validate_arguments
+
 # ASRM URLs
 ASRM_BASE_URL = "https://www.asrm.org"
 PRACTICE_GUIDANCE_URL = f"{ASRM_BASE_URL}/practice-guidance/"
 PRACTICE_DOCUMENTS_URL = f"{ASRM_BASE_URL}/practice-guidance/practice-committee-documents/"
 ETHICS_OPINIONS_URL = f"{ASRM_BASE_URL}/practice-guidance/ethics-opinions/"
 
+# Document listings are re-scraped at most once an hour
+LISTING_CACHE_TTL = 3600
+
+# Individual documents are kept for a day
+CONTENT_CACHE_TTL = 86400
+CONTENT_CACHE_SIZE = 64
+
 # Create server instance
 server = Server("asrm-server")
 
@@ -38,12 +55,13 @@ async def fetch_page(url: str) -> str:
     Returns:
         HTML content as string
     """
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        response = await client.get(url, timeout=30.0)
-        response.raise_for_status()
-        return response.text
+    client = get_client()
+    response = await client.get(url, timeout=30.0, follow_redirects=True)
+    response.raise_for_status()
+    return response.text
 
 
+@async_lru_cache(maxsize=1, ttl=LISTING_CACHE_TTL)
 async def parse_practice_documents() -> list[dict[str, Any]]:
     """
     Parse the practice guidance page to extract available documents.
@@ -52,7 +70,7 @@ async def parse_practice_documents() -> list[dict[str, Any]]:
         List of documents with title, URL, and description
     """
     html = await fetch_page(PRACTICE_GUIDANCE_URL)
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     documents = []
 
@@ -117,6 +135,7 @@ async def parse_practice_documents() -> list[dict[str, Any]]:
     return unique_documents
 
 
+@async_lru_cache(maxsize=1, ttl=LISTING_CACHE_TTL)
 async def parse_ethics_opinions() -> list[dict[str, Any]]:
     """
     Parse the ethics opinions page to extract available opinions.
@@ -125,7 +144,7 @@ async def parse_ethics_opinions() -> list[dict[str, Any]]:
         List of ethics opinions with title, URL, and description
     """
     html = await fetch_page(PRACTICE_GUIDANCE_URL)
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     opinions = []
 
@@ -211,6 +230,7 @@ async def search_guidelines(query: str, category: Optional[str] = None) -> list[
     return matching_docs
 
 
+@async_lru_cache(maxsize=CONTENT_CACHE_SIZE, ttl=CONTENT_CACHE_TTL)
 async def get_guideline_content(url: str) -> dict[str, Any]:
     """
     Fetch the full content of a specific guideline document.
@@ -222,7 +242,7 @@ async def get_guideline_content(url: str) -> dict[str, Any]:
         Dictionary with title, content, and metadata
     """
     html = await fetch_page(url)
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     # Extract title
     title_elem = soup.find('h1')
@@ -272,161 +292,192 @@ async def get_guideline_content(url: str) -> dict[str, Any]:
     }
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """
-    List available tools.
-    """
-    return [
-        types.Tool(
-            name="list_practice_documents",
-            description="List available ASRM practice committee documents and guidelines",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        ),
-        types.Tool(
-            name="list_ethics_opinions",
-            description="List available ASRM ethics committee opinions",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        ),
-        types.Tool(
-            name="search_asrm_guidelines",
-            description="Search ASRM guidelines by keyword. Can filter by category (practice or ethics).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'IVF', 'endometriosis', 'genetic testing')"
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "Optional category filter: 'practice' or 'ethics'",
-                        "enum": ["practice", "ethics"]
-                    }
+# Static tool definitions, shared by every list_tools request
+TOOLS = [
+    types.Tool(
+        name="list_practice_documents",
+        description="List available ASRM practice committee documents and guidelines",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+    ),
+    types.Tool(
+        name="list_ethics_opinions",
+        description="List available ASRM ethics committee opinions",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+    ),
+    types.Tool(
+        name="search_asrm_guidelines",
+        description="Search ASRM guidelines by keyword. Can filter by category (practice or ethics).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'IVF', 'endometriosis', 'genetic testing')"
                 },
-                "required": ["query"]
+                "category": {
+                    "type": "string",
+                    "description": "Optional category filter: 'practice' or 'ethics'",
+                    "enum": ["practice", "ethics"]
+                }
             },
-        ),
-        types.Tool(
-            name="get_guideline_content",
-            description="Retrieve the full content of a specific ASRM guideline document by URL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "Full URL of the guideline document"
-                    }
-                },
-                "required": ["url"]
+            "required": ["query"]
+        },
+    ),
+    types.Tool(
+        name="get_guideline_content",
+        description="Retrieve the full content of a specific ASRM guideline document by URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "Full URL of the guideline document"
+                }
             },
-        ),
-    ]
+            "required": ["url"]
+        },
+    ),
+]
 
+VALIDATORS = compile_validators(TOOLS)
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
     """
-    Handle tool execution requests.
+    List available tools.
     """
-    try:
-        if name == "list_practice_documents":
-            documents = await parse_practice_documents()
+    return TOOLS
+
+
+async def _handle_list_practice_documents(arguments: dict | None) -> list[types.TextContent]:
+    """List ASRM practice committee documents."""
+    documents = await parse_practice_documents()
+
+    parts = ["# ASRM Practice Documents\n\n"]
+    parts.append(f"Found {len(documents)} practice documents:\n\n")
+
+    for i, doc in enumerate(documents[:20], 1):  # Limit to 20 for readability
+        parts.append(f"{i}. **{doc['title']}**\n")
+        if doc['description']:
+            parts.append(f"   {doc['description']}\n")
+        parts.append(f"   URL: {doc['url']}\n\n")
+
+    if len(documents) > 20:
+        parts.append(f"\n...and {len(documents) - 20} more documents.\n")
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_list_ethics_opinions(arguments: dict | None) -> list[types.TextContent]:
+    """List ASRM ethics committee opinions."""
+    opinions = await parse_ethics_opinions()
 
-            result = "# ASRM Practice Documents\n\n"
-            result += f"Found {len(documents)} practice documents:\n\n"
+    parts = ["# ASRM Ethics Opinions\n\n"]
+    parts.append(f"Found {len(opinions)} ethics opinions:\n\n")
 
-            for i, doc in enumerate(documents[:20], 1):  # Limit to 20 for readability
-                result += f"{i}. **{doc['title']}**\n"
-                if doc['description']:
-                    result += f"   {doc['description']}\n"
-                result += f"   URL: {doc['url']}\n\n"
+    for i, op in enumerate(opinions[:20], 1):
+        parts.append(f"{i}. **{op['title']}**\n")
+        if op['description']:
+            parts.append(f"   {op['description']}\n")
+        parts.append(f"   URL: {op['url']}\n\n")
 
-            if len(documents) > 20:
-                result += f"\n...and {len(documents) - 20} more documents.\n"
+    if len(opinions) > 20:
+        parts.append(f"\n...and {len(opinions) - 20} more opinions.\n")
 
-            return [types.TextContent(type="text", text=result)]
+    return [types.TextContent(type="text", text="".join(parts))]
 
-        elif name == "list_ethics_opinions":
-            opinions = await parse_ethics_opinions()
 
-            result = "# ASRM Ethics Opinions\n\n"
-            result += f"Found {len(opinions)} ethics opinions:\n\n"
+async def _handle_search_asrm_guidelines(arguments: dict | None) -> list[types.TextContent]:
+    """Search ASRM guidance by keyword and optional category."""
+    if not arguments or "query" not in arguments:
+        raise ValueError("query parameter is required")
 
-            for i, op in enumerate(opinions[:20], 1):
-                result += f"{i}. **{op['title']}**\n"
-                if op['description']:
-                    result += f"   {op['description']}\n"
-                result += f"   URL: {op['url']}\n\n"
+    query = arguments["query"]
+    category = arguments.get("category")
 
-            if len(opinions) > 20:
-                result += f"\n...and {len(opinions) - 20} more opinions.\n"
+    results = await search_guidelines(query, category)
 
-            return [types.TextContent(type="text", text=result)]
+    parts = [f"# Search Results for '{query}'\n\n"]
 
-        elif name == "search_asrm_guidelines":
-            if not arguments or "query" not in arguments:
-                raise ValueError("query parameter is required")
+    if category:
+        parts.append(f"Category: {category}\n\n")
 
-            query = arguments["query"]
-            category = arguments.get("category")
+    parts.append(f"Found {len(results)} matching documents:\n\n")
 
-            results = await search_guidelines(query, category)
+    for i, doc in enumerate(results, 1):
+        parts.append(f"{i}. **{doc['title']}**\n")
+        parts.append(f"   Type: {doc['type']}\n")
+        if doc['description']:
+            parts.append(f"   {doc['description']}\n")
+        parts.append(f"   URL: {doc['url']}\n\n")
 
-            result = f"# Search Results for '{query}'\n\n"
+    if not results:
+        parts.append("No documents found matching your query.\n")
+        parts.append("Try different keywords or browse all documents using list_practice_documents or list_ethics_opinions.\n")
 
-            if category:
-                result += f"Category: {category}\n\n"
+    return [types.TextContent(type="text", text="".join(parts))]
 
-            result += f"Found {len(results)} matching documents:\n\n"
 
-            for i, doc in enumerate(results, 1):
-                result += f"{i}. **{doc['title']}**\n"
-                result += f"   Type: {doc['type']}\n"
-                if doc['description']:
-                    result += f"   {doc['description']}\n"
-                result += f"   URL: {doc['url']}\n\n"
+async def _handle_get_guideline_content(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch and format the content of one ASRM document."""
+    if not arguments or "url" not in arguments:
+        raise ValueError("url parameter is required")
 
-            if not results:
-                result += "No documents found matching your query.\n"
-                result += "Try different keywords or browse all documents using list_practice_documents or list_ethics_opinions.\n"
+    url = arguments["url"]
+    content = await get_guideline_content(url)
 
-            return [types.TextContent(type="text", text=result)]
+    parts = [f"# {content['title']}\n\n"]
+    parts.append(f"**URL:** {content['url']}\n")
+    if content['date']:
+        parts.append(f"**Date:** {content['date']}\n")
+    parts.append(f"**Word Count:** {content['word_count']}\n\n")
+    parts.append("---\n\n")
+    parts.append(content['content'])
 
-        elif name == "get_guideline_content":
-            if not arguments or "url" not in arguments:
-                raise ValueError("url parameter is required")
+    return [types.TextContent(type="text", text="".join(parts))]
 
-            url = arguments["url"]
-            content = await get_guideline_content(url)
 
-            result = f"# {content['title']}\n\n"
-            result += f"**URL:** {content['url']}\n"
-            if content['date']:
-                result += f"**Date:** {content['date']}\n"
-            result += f"**Word Count:** {content['word_count']}\n\n"
-            result += "---\n\n"
-            result += content['content']
+# Tool name -> handler; handle_call_tool dispatches with a single lookup
+TOOL_HANDLERS = {
+    "list_practice_documents": _handle_list_practice_documents,
+    "list_ethics_opinions": _handle_list_ethics_opinions,
+    "search_asrm_guidelines": _handle_search_asrm_guidelines,
+    "get_guideline_content": _handle_get_guideline_content,
+}
 
-            return [types.TextContent(type="text", text=result)]
 
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+@server.call_tool(validate_input=False)
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests.
 
-    except Exception as e:
+    Bad arguments and upstream HTTP failures are reported as tool output,
+    tagged with the exception type; anything else propagates to the MCP
+    framework as an error result.
+    """
+    validate_arguments(VALIDATORS, name, arguments)
+
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    try:
+        return await handler(arguments)
+    except (ValueError, KeyError, httpx.HTTPError, asyncio.TimeoutError) as e:
         return [types.TextContent(
             type="text",
-            text=f"Error executing {name}: {str(e)}"
+            text=f"Error executing {name} ({type(e).__name__}): {str(e)}"
         )]
 
 
@@ -434,20 +485,26 @@ async def main():
     """
     Main entry point for the ASRM MCP server.
     """
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="asrm-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    warmup = asyncio.create_task(preconnect(PRACTICE_GUIDANCE_URL))
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="asrm-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        warmup.cancel()
+        await close_client()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Small in-process caches for the research servers.
+
+The upstream sources (PubMed, society guideline pages) change rarely, and
+the same records get requested repeatedly within a session, so results
+are memoised in memory keyed by the call arguments.
+"""
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def async_lru_cache(maxsize: int = 1024, ttl: Optional[float] = None) -> Callable[
+    [Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]
+]:
+    """
+    Memoise an async function with a bounded least-recently-used cache.
+
+    Only successful results are stored; exceptions propagate and are retried
+    on the next call. Cached values are shared, so callers must not mutate
+    them. The wrapper's cache_get/cache_set let a bulk fetch read and fill
+    the same cache, and cache_clear empties it.
+
+    Args:
+        maxsize: Maximum number of entries kept before evicting the oldest
+        ttl: Seconds an entry stays valid (None keeps entries until evicted)
+
+    Returns:
+        Decorator wrapping the coroutine function
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        entries: "OrderedDict[Any, tuple[float, T]]" = OrderedDict()
+
+        def lookup(key: Any) -> tuple[bool, Optional[T]]:
+            if key in entries:
+                expires, value = entries[key]
+                if expires > time.monotonic():
+                    entries.move_to_end(key)
+                    return True, value
+                del entries[key]
+            return False, None
+
+        def store(key: Any, value: T) -> None:
+            expires = time.monotonic() + ttl if ttl is not None else float("inf")
+            entries[key] = (expires, value)
+            entries.move_to_end(key)
+            if len(entries) > maxsize:
+                entries.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            hit, value = lookup(key)
+            if hit:
+                return value
+
+            value = await func(*args, **kwargs)
+            store(key, value)
+            return value
+
+        def cache_get(*args, **kwargs) -> Optional[T]:
+            """Return the cached result for these arguments, or None if absent."""
+            return lookup((args, tuple(sorted(kwargs.items()))))[1]
+
+        def cache_set(value: T, *args, **kwargs) -> None:
+            """Store a result fetched elsewhere, as if func(*args, **kwargs) returned it."""
+            store((args, tuple(sorted(kwargs.items()))), value)
+
+        wrapper.cache_get = cache_get
+        wrapper.cache_set = cache_set
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
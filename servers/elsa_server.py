@@ -14,15 +14,25 @@ Features:
 """
 
 import asyncio
-import json
+import sys
+import functools
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import re
+from pathlib import Path
+from typing import Any
 
 import mcp.types as types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.event_loop import install_uvloop
+from servers.serialization import dumps
+from servers.validation import compile_validators, validate_arguments
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("elsa-server")
@@ -202,509 +212,594 @@ ELSA_DATA_MODULES = {
     }
 }
 
+# Module IDs in a fixed, sorted order so the tool schemas serialize identically
+# on every run and clients can cache them
+ELSA_MODULE_IDS = tuple(sorted(ELSA_DATA_MODULES))
+
+# Lowercased UTF-8 search text for each module, built once since the catalogue
+# is static. Matching on bytes skips str's per-character width handling and
+# gives the same results, since UTF-8 substrings line up with str substrings:
+# module_id -> (name/description/variables bytes, [(variable, variable_lower_bytes), ...])
+ELSA_SEARCH_INDEX = {
+    mod_id: (
+        f"{mod_data['name']} {mod_data['description']} {' '.join(mod_data['variables'])}".lower().encode(),
+        [(variable, variable.lower().encode()) for variable in mod_data["variables"]],
+    )
+    for mod_id, mod_data in ELSA_DATA_MODULES.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(query: str) -> re.Pattern:
+    """Compile a query into one bytes pattern matching any of its whitespace-separated terms."""
+    terms = query.split() or [query]
+    return re.compile(b"|".join(re.escape(term.encode()) for term in terms))
+
+
+def search_modules(query: str, module: str | None = None) -> list[dict[str, Any]]:
+    """
+    Search the ELSA data module catalogue.
+
+    A module matches if any term of the query appears in it, so multi-word
+    queries like "depression loneliness" return every relevant module.
+
+    Args:
+        query: Lowercased search terms
+        module: Restrict the search to one module ID (optional)
+
+    Returns:
+        Matching modules with the variables that contain a query term
+    """
+    pattern = _compile_query(query)
+    module_ids = [module] if module else ELSA_SEARCH_INDEX.keys()
+
+    results = []
+    for mod_id in module_ids:
+        searchable_text, variables = ELSA_SEARCH_INDEX[mod_id]
+
+        if pattern.search(searchable_text):
+            mod_data = ELSA_DATA_MODULES[mod_id]
+            results.append({
+                "module_id": mod_id,
+                "module_name": mod_data["name"],
+                "description": mod_data["description"],
+                "relevant_variables": [v for v, v_lower in variables if pattern.search(v_lower)]
+            })
+
+    return results
+
+
+def build_wave_listing(include_details: bool) -> dict[str, Any]:
+    """Build the list_elsa_waves payload from the static wave table."""
+    if include_details:
+        return {
+            "study": ELSA_FULL_NAME,
+            "study_number": ELSA_STUDY_NUMBER,
+            "total_waves": len(ELSA_WAVES),
+            "waves": ELSA_WAVES
+        }
+
+    return {
+        "study": ELSA_FULL_NAME,
+        "total_waves": len(ELSA_WAVES),
+        "waves": [
+            {
+                "wave": v["wave"],
+                "name": v["name"],
+                "year": v["year"]
+            }
+            for v in ELSA_WAVES.values()
+        ]
+    }
+
+
+# Both wave listings are static, so their responses are serialized once at import
+_WAVES_BRIEF_RESPONSE = [types.TextContent(type="text", text=dumps(build_wave_listing(False)))]
+_WAVES_DETAIL_RESPONSE = [types.TextContent(type="text", text=dumps(build_wave_listing(True)))]
+
+
+def _error_response(message: str) -> list[types.TextContent]:
+    """Wrap an error message in the server's JSON error payload."""
+    return [types.TextContent(type="text", text=dumps({"error": message}))]
+
+
+# Error text that never changes is built once as well
+_AVAILABLE_MODULES = str(list(ELSA_DATA_MODULES))
+_NO_WAVES_RESPONSE = _error_response("No waves specified for comparison")
+
+
 # Initialize MCP server
 app = Server("elsa-server")
 
 
-@app.list_tools()
-async def list_tools() -> list[types.Tool]:
-    """List available ELSA data tools."""
-    return [
-        types.Tool(
-            name="list_elsa_waves",
-            description="List all available ELSA waves with basic information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_details": {
-                        "type": "boolean",
-                        "description": "Include detailed information about each wave",
-                        "default": False
-                    }
+# Tool schemas never change at runtime, so they are built once at import
+TOOLS = [
+    types.Tool(
+        name="list_elsa_waves",
+        description="List all available ELSA waves with basic information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_details": {
+                    "type": "boolean",
+                    "description": "Include detailed information about each wave",
+                    "default": False
                 }
             }
-        ),
-        types.Tool(
-            name="get_wave_details",
-            description="Get detailed information about a specific ELSA wave",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wave": {
-                        "type": "string",
-                        "description": "Wave number (0-11) or 'latest' for most recent wave"
-                    }
-                },
-                "required": ["wave"]
-            }
-        ),
-        types.Tool(
-            name="search_data_modules",
-            description="Search ELSA data modules and variables by topic or keyword",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search term (e.g., 'cognitive', 'depression', 'wealth')"
-                    },
-                    "module": {
-                        "type": "string",
-                        "description": "Specific module to search (optional)",
-                        "enum": list(ELSA_DATA_MODULES.keys())
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_data_module_info",
-            description="Get detailed information about a specific ELSA data module",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "module": {
-                        "type": "string",
-                        "description": "Module identifier",
-                        "enum": list(ELSA_DATA_MODULES.keys())
-                    }
+        }
+    ),
+    types.Tool(
+        name="get_wave_details",
+        description="Get detailed information about a specific ELSA wave",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "wave": {
+                    "type": "string",
+                    "description": "Wave number (0-11) or 'latest' for most recent wave"
+                }
+            },
+            "required": ["wave"]
+        }
+    ),
+    types.Tool(
+        name="search_data_modules",
+        description="Search ELSA data modules and variables by topic or keyword",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search term(s); a module matches if any term appears (e.g., 'cognitive', 'depression wealth')"
                 },
-                "required": ["module"]
-            }
-        ),
-        types.Tool(
-            name="get_access_information",
-            description="Get information on how to access ELSA data from UK Data Service",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "detailed": {
-                        "type": "boolean",
-                        "description": "Include detailed step-by-step access instructions",
-                        "default": True
-                    }
+                "module": {
+                    "type": "string",
+                    "description": "Specific module to search (optional)",
+                    "enum": list(ELSA_MODULE_IDS)
                 }
-            }
-        ),
-        types.Tool(
-            name="get_study_metadata",
-            description="Get comprehensive metadata about the ELSA study",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        types.Tool(
-            name="get_documentation_links",
-            description="Get links to ELSA documentation, questionnaires, and user guides",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wave": {
-                        "type": "string",
-                        "description": "Specific wave number (optional, returns all if not specified)"
-                    },
-                    "doc_type": {
-                        "type": "string",
-                        "description": "Type of documentation",
-                        "enum": ["questionnaire", "user_guide", "technical", "data_dictionary", "all"]
-                    }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="get_data_module_info",
+        description="Get detailed information about a specific ELSA data module",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "module": {
+                    "type": "string",
+                    "description": "Module identifier",
+                    "enum": list(ELSA_MODULE_IDS)
+                }
+            },
+            "required": ["module"]
+        }
+    ),
+    types.Tool(
+        name="get_access_information",
+        description="Get information on how to access ELSA data from UK Data Service",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Include detailed step-by-step access instructions",
+                    "default": True
                 }
             }
-        ),
-        types.Tool(
-            name="compare_waves",
-            description="Compare variables and topics across multiple ELSA waves",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "waves": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of wave numbers to compare (e.g., ['1', '5', '9'])"
-                    },
-                    "focus": {
-                        "type": "string",
-                        "description": "Specific aspect to focus comparison on",
-                        "enum": ["topics", "sample_size", "all"]
-                    }
+        }
+    ),
+    types.Tool(
+        name="get_study_metadata",
+        description="Get comprehensive metadata about the ELSA study",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    types.Tool(
+        name="get_documentation_links",
+        description="Get links to ELSA documentation, questionnaires, and user guides",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "wave": {
+                    "type": "string",
+                    "description": "Specific wave number (optional, returns all if not specified)"
                 },
-                "required": ["waves"]
+                "doc_type": {
+                    "type": "string",
+                    "description": "Type of documentation",
+                    "enum": ["questionnaire", "user_guide", "technical", "data_dictionary", "all"]
+                }
             }
-        ),
-        types.Tool(
-            name="get_research_examples",
-            description="Get examples of research questions that can be answered with ELSA data",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Research topic area (optional)"
-                    }
+        }
+    ),
+    types.Tool(
+        name="compare_waves",
+        description="Compare variables and topics across multiple ELSA waves",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "waves": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of wave numbers to compare (e.g., ['1', '5', '9'])"
+                },
+                "focus": {
+                    "type": "string",
+                    "description": "Specific aspect to focus comparison on",
+                    "enum": ["topics", "sample_size", "all"]
+                }
+            },
+            "required": ["waves"]
+        }
+    ),
+    types.Tool(
+        name="get_research_examples",
+        description="Get examples of research questions that can be answered with ELSA data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "Research topic area (optional)"
                 }
             }
-        )
-    ]
+        }
+    )
+]
 
+VALIDATORS = compile_validators(TOOLS)
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[types.TextContent]:
-    """Handle tool calls for ELSA data access."""
 
-    if name == "list_elsa_waves":
-        include_details = arguments.get("include_details", False)
+@app.list_tools()
+async def list_tools() -> list[types.Tool]:
+    """List available ELSA data tools."""
+    return TOOLS
+
 
-        if include_details:
-            result = {
-                "study": ELSA_FULL_NAME,
-                "study_number": ELSA_STUDY_NUMBER,
-                "total_waves": len(ELSA_WAVES),
-                "waves": ELSA_WAVES
-            }
-        else:
-            result = {
-                "study": ELSA_FULL_NAME,
-                "total_waves": len(ELSA_WAVES),
-                "waves": [
-                    {
-                        "wave": v["wave"],
-                        "name": v["name"],
-                        "year": v["year"]
-                    }
-                    for v in ELSA_WAVES.values()
-                ]
-            }
+async def _handle_list_elsa_waves(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """List the ELSA waves, optionally with full details."""
+    if arguments.get("include_details", False):
+        return _WAVES_DETAIL_RESPONSE
+    return _WAVES_BRIEF_RESPONSE
 
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
 
-    elif name == "get_wave_details":
-        wave = arguments.get("wave")
+async def _handle_get_wave_details(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Return details for a single wave."""
+    wave = arguments.get("wave")
 
-        if wave == "latest":
-            wave = "11"
+    if wave == "latest":
+        wave = "11"
 
-        if wave not in ELSA_WAVES:
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": f"Wave {wave} not found. Available waves: 0-11"
-                }, indent=2)
-            )]
-
-        wave_info = ELSA_WAVES[wave].copy()
-        wave_info["ukds_url"] = f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}"
-        wave_info["project_url"] = f"{ELSA_PROJECT_URL}/data-and-documentation"
-
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(wave_info, indent=2)
-        )]
-
-    elif name == "search_data_modules":
-        query = arguments.get("query", "").lower()
-        module_filter = arguments.get("module")
-
-        results = []
-
-        modules_to_search = {module_filter: ELSA_DATA_MODULES[module_filter]} if module_filter else ELSA_DATA_MODULES
-
-        for mod_id, mod_data in modules_to_search.items():
-            # Search in name, description, and variables
-            searchable_text = f"{mod_data['name']} {mod_data['description']} {' '.join(mod_data['variables'])}".lower()
-
-            if query in searchable_text:
-                results.append({
-                    "module_id": mod_id,
-                    "module_name": mod_data["name"],
-                    "description": mod_data["description"],
-                    "relevant_variables": [v for v in mod_data["variables"] if query in v.lower()]
-                })
-
-        return [types.TextContent(
-            type="text",
-            text=json.dumps({
-                "query": query,
-                "results_found": len(results),
-                "modules": results
-            }, indent=2)
-        )]
-
-    elif name == "get_data_module_info":
-        module = arguments.get("module")
-
-        if module not in ELSA_DATA_MODULES:
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": f"Module '{module}' not found. Available modules: {list(ELSA_DATA_MODULES.keys())}"
-                }, indent=2)
-            )]
-
-        module_info = ELSA_DATA_MODULES[module].copy()
-        module_info["module_id"] = module
-
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(module_info, indent=2)
-        )]
-
-    elif name == "get_access_information":
-        detailed = arguments.get("detailed", True)
-
-        access_info = {
-            "study": ELSA_FULL_NAME,
-            "study_number": ELSA_STUDY_NUMBER,
-            "data_provider": "UK Data Service (UKDS)",
-            "access_url": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}",
-            "contact_email": ELSA_DATA_EMAIL,
-            "registration_required": True,
-            "access_levels": {
-                "open": "Some datasets available without registration",
-                "safeguarded": "Most ELSA data - requires UKDS registration",
-                "controlled": "Sensitive data - requires SecureLab access"
-            }
-        }
+    if wave not in ELSA_WAVES:
+        return _error_response(f"Wave {wave} not found. Available waves: 0-11")
 
-        if detailed:
-            access_info["access_steps"] = [
-                {
-                    "step": 1,
-                    "action": "Register with UK Data Service",
-                    "url": "https://ukdataservice.ac.uk/",
-                    "notes": "UK academics can use institutional login (UKAMF). Others can create free account."
-                },
-                {
-                    "step": 2,
-                    "action": "Search for ELSA data",
-                    "url": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}",
-                    "notes": "Study Number: SN 5050 - English Longitudinal Study of Ageing: Waves 0-11"
-                },
-                {
-                    "step": 3,
-                    "action": "Review data documentation",
-                    "notes": "Check questionnaires, user guides, and data dictionaries"
-                },
-                {
-                    "step": 4,
-                    "action": "Accept End User License",
-                    "notes": "Agree to terms of use for data access"
-                },
-                {
-                    "step": 5,
-                    "action": "Download data",
-                    "notes": "Available formats: SPSS, Stata, tab-delimited"
-                }
-            ]
+    wave_info = ELSA_WAVES[wave].copy()
+    wave_info["ukds_url"] = f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}"
+    wave_info["project_url"] = f"{ELSA_PROJECT_URL}/data-and-documentation"
 
-            access_info["programmatic_access"] = {
-                "r_package": {
-                    "name": "ukds",
-                    "description": "R package for downloading UKDS datasets programmatically",
-                    "repository": "CRAN"
-                },
-                "python_package": {
-                    "name": "ukds",
-                    "description": "Python package for working with UKDS datasets",
-                    "repository": "PyPI"
-                }
-            }
+    return [types.TextContent(
+        type="text",
+        text=dumps(wave_info)
+    )]
 
-            access_info["controlled_data_access"] = {
-                "method": "UK Data Service SecureLab",
-                "description": "Remote access safe environment for sensitive data",
-                "requirements": "Separate application required",
-                "url": "https://ukdataservice.ac.uk/help/secure-lab/"
-            }
 
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(access_info, indent=2)
-        )]
+async def _handle_search_data_modules(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Search data modules and variables using the precomputed index."""
+    query = arguments.get("query", "").lower()
+    module_filter = arguments.get("module")
 
-    elif name == "get_study_metadata":
-        metadata = {
-            "study_name": ELSA_FULL_NAME,
-            "study_number": ELSA_STUDY_NUMBER,
-            "principal_investigators": [
-                "Professor Andrew Steptoe (University College London)",
-                "Dr. Daisy Fancourt (University College London)"
-            ],
-            "funding": "National Institute on Aging (NIA), UK Government departments",
-            "study_design": "Longitudinal panel study",
-            "target_population": "Adults aged 50 and over living in England",
-            "baseline_year": 1998,
-            "total_waves": len(ELSA_WAVES),
-            "latest_wave": 11,
-            "latest_fieldwork": "2023-2024",
-            "data_collection_modes": [
-                "Face-to-face computer-assisted interviews",
-                "Self-completion questionnaires",
-                "Nurse visits (selected waves)",
-                "Biomarker collection"
-            ],
-            "key_domains": list(ELSA_DATA_MODULES.keys()),
-            "geographic_coverage": "England (representative sample)",
-            "data_formats": ["SPSS", "Stata", "Tab-delimited"],
-            "citation": "NatCen Social Research, University College London, Institute for Fiscal Studies. (2024). English Longitudinal Study of Ageing. [data collection]. UK Data Service. SN: 5050, DOI: 10.5255/UKDA-SN-5050-25",
-            "project_website": ELSA_PROJECT_URL,
-            "documentation_url": f"{ELSA_PROJECT_URL}/data-and-documentation",
-            "ukds_url": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}"
-        }
+    results = search_modules(query, module_filter)
+
+    return [types.TextContent(
+        type="text",
+        text=dumps({
+            "query": query,
+            "results_found": len(results),
+            "modules": results
+        })
+    )]
+
+
+async def _handle_get_data_module_info(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Return the description and variables of a data module."""
+    module = arguments.get("module")
 
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(metadata, indent=2)
-        )]
-
-    elif name == "get_documentation_links":
-        wave = arguments.get("wave")
-        doc_type = arguments.get("doc_type", "all")
-
-        base_docs = {
-            "main_project_site": ELSA_PROJECT_URL,
-            "data_documentation": f"{ELSA_PROJECT_URL}/data-and-documentation",
-            "ukds_catalogue": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}",
-            "user_guides": f"{ELSA_PROJECT_URL}/data-and-documentation",
-            "questionnaires": f"{ELSA_PROJECT_URL}/data-and-documentation",
-            "technical_reports": f"{ELSA_PROJECT_URL}/publications",
-            "data_dictionaries": "Available via UKDS download",
-            "faqs": f"{ELSA_PROJECT_URL}/frequently-asked-questions"
+    if module not in ELSA_DATA_MODULES:
+        return _error_response(f"Module '{module}' not found. Available modules: {_AVAILABLE_MODULES}")
+
+    module_info = ELSA_DATA_MODULES[module].copy()
+    module_info["module_id"] = module
+
+    return [types.TextContent(
+        type="text",
+        text=dumps(module_info)
+    )]
+
+
+async def _handle_get_access_information(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Explain how to obtain ELSA data from the UK Data Service."""
+    detailed = arguments.get("detailed", True)
+
+    access_info = {
+        "study": ELSA_FULL_NAME,
+        "study_number": ELSA_STUDY_NUMBER,
+        "data_provider": "UK Data Service (UKDS)",
+        "access_url": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}",
+        "contact_email": ELSA_DATA_EMAIL,
+        "registration_required": True,
+        "access_levels": {
+            "open": "Some datasets available without registration",
+            "safeguarded": "Most ELSA data - requires UKDS registration",
+            "controlled": "Sensitive data - requires SecureLab access"
         }
+    }
 
-        result = {
-            "study": ELSA_FULL_NAME,
-            "documentation_links": base_docs,
-            "contact": {
-                "data_queries": ELSA_DATA_EMAIL,
-                "general_enquiries": f"{ELSA_PROJECT_URL}/contact"
+    if detailed:
+        access_info["access_steps"] = [
+            {
+                "step": 1,
+                "action": "Register with UK Data Service",
+                "url": "https://ukdataservice.ac.uk/",
+                "notes": "UK academics can use institutional login (UKAMF). Others can create free account."
+            },
+            {
+                "step": 2,
+                "action": "Search for ELSA data",
+                "url": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}",
+                "notes": "Study Number: SN 5050 - English Longitudinal Study of Ageing: Waves 0-11"
             },
-            "notes": [
-                "Detailed wave-specific documentation available after UKDS registration",
-                "User guides include variable derivations and technical details",
-                "Questionnaires show exact wording of questions asked"
-            ]
+            {
+                "step": 3,
+                "action": "Review data documentation",
+                "notes": "Check questionnaires, user guides, and data dictionaries"
+            },
+            {
+                "step": 4,
+                "action": "Accept End User License",
+                "notes": "Agree to terms of use for data access"
+            },
+            {
+                "step": 5,
+                "action": "Download data",
+                "notes": "Available formats: SPSS, Stata, tab-delimited"
+            }
+        ]
+
+        access_info["programmatic_access"] = {
+            "r_package": {
+                "name": "ukds",
+                "description": "R package for downloading UKDS datasets programmatically",
+                "repository": "CRAN"
+            },
+            "python_package": {
+                "name": "ukds",
+                "description": "Python package for working with UKDS datasets",
+                "repository": "PyPI"
+            }
+        }
+
+        access_info["controlled_data_access"] = {
+            "method": "UK Data Service SecureLab",
+            "description": "Remote access safe environment for sensitive data",
+            "requirements": "Separate application required",
+            "url": "https://ukdataservice.ac.uk/help/secure-lab/"
         }
 
-        if wave:
-            result["wave"] = wave
-            result["note"] = f"Wave {wave} specific documentation available via UKDS after registration"
+    return [types.TextContent(
+        type="text",
+        text=dumps(access_info)
+    )]
+
+
+async def _handle_get_study_metadata(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Return study-level metadata and citation details."""
+    metadata = {
+        "study_name": ELSA_FULL_NAME,
+        "study_number": ELSA_STUDY_NUMBER,
+        "principal_investigators": [
+            "Professor Andrew Steptoe (University College London)",
+            "Dr. Daisy Fancourt (University College London)"
+        ],
+        "funding": "National Institute on Aging (NIA), UK Government departments",
+        "study_design": "Longitudinal panel study",
+        "target_population": "Adults aged 50 and over living in England",
+        "baseline_year": 1998,
+        "total_waves": len(ELSA_WAVES),
+        "latest_wave": 11,
+        "latest_fieldwork": "2023-2024",
+        "data_collection_modes": [
+            "Face-to-face computer-assisted interviews",
+            "Self-completion questionnaires",
+            "Nurse visits (selected waves)",
+            "Biomarker collection"
+        ],
+        "key_domains": list(ELSA_DATA_MODULES.keys()),
+        "geographic_coverage": "England (representative sample)",
+        "data_formats": ["SPSS", "Stata", "Tab-delimited"],
+        "citation": "NatCen Social Research, University College London, Institute for Fiscal Studies. (2024). English Longitudinal Study of Ageing. [data collection]. UK Data Service. SN: 5050, DOI: 10.5255/UKDA-SN-5050-25",
+        "project_website": ELSA_PROJECT_URL,
+        "documentation_url": f"{ELSA_PROJECT_URL}/data-and-documentation",
+        "ukds_url": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}"
+    }
 
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
+    return [types.TextContent(
+        type="text",
+        text=dumps(metadata)
+    )]
+
+
+async def _handle_get_documentation_links(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Return links to ELSA documentation."""
+    wave = arguments.get("wave")
+    doc_type = arguments.get("doc_type", "all")
+
+    base_docs = {
+        "main_project_site": ELSA_PROJECT_URL,
+        "data_documentation": f"{ELSA_PROJECT_URL}/data-and-documentation",
+        "ukds_catalogue": f"{UKDS_BASE_URL}/datacatalogue/studies/study?id={ELSA_STUDY_NUMBER}",
+        "user_guides": f"{ELSA_PROJECT_URL}/data-and-documentation",
+        "questionnaires": f"{ELSA_PROJECT_URL}/data-and-documentation",
+        "technical_reports": f"{ELSA_PROJECT_URL}/publications",
+        "data_dictionaries": "Available via UKDS download",
+        "faqs": f"{ELSA_PROJECT_URL}/frequently-asked-questions"
+    }
 
-    elif name == "compare_waves":
-        waves = arguments.get("waves", [])
-        focus = arguments.get("focus", "all")
+    result = {
+        "study": ELSA_FULL_NAME,
+        "documentation_links": base_docs,
+        "contact": {
+            "data_queries": ELSA_DATA_EMAIL,
+            "general_enquiries": f"{ELSA_PROJECT_URL}/contact"
+        },
+        "notes": [
+            "Detailed wave-specific documentation available after UKDS registration",
+            "User guides include variable derivations and technical details",
+            "Questionnaires show exact wording of questions asked"
+        ]
+    }
 
-        if not waves:
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({"error": "No waves specified for comparison"}, indent=2)
-            )]
+    if wave:
+        result["wave"] = wave
+        result["note"] = f"Wave {wave} specific documentation available via UKDS after registration"
 
-        comparison = {
-            "waves_compared": waves,
-            "comparison": {}
-        }
+    return [types.TextContent(
+        type="text",
+        text=dumps(result)
+    )]
 
-        for wave in waves:
-            if wave not in ELSA_WAVES:
-                comparison["comparison"][wave] = {"error": "Wave not found"}
-                continue
 
-            wave_data = ELSA_WAVES[wave]
+async def _handle_compare_waves(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Compare topics and sample sizes across waves."""
+    waves = arguments.get("waves", [])
+    focus = arguments.get("focus", "all")
 
-            if focus == "all" or focus == "topics":
-                comparison["comparison"][wave] = {
-                    "name": wave_data["name"],
-                    "year": wave_data["year"],
-                    "key_topics": wave_data["key_topics"]
-                }
+    if not waves:
+        return _NO_WAVES_RESPONSE
 
-            if focus == "all" or focus == "sample_size":
-                if wave not in comparison["comparison"]:
-                    comparison["comparison"][wave] = {}
-                comparison["comparison"][wave]["sample_size"] = wave_data["sample_size"]
-                comparison["comparison"][wave]["fieldwork_period"] = wave_data["fieldwork_period"]
-
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(comparison, indent=2)
-        )]
-
-    elif name == "get_research_examples":
-        topic = arguments.get("topic", "general")
-
-        research_examples = {
-            "general": [
-                "How does health change with age in the English population?",
-                "What are the predictors of successful aging?",
-                "How do social determinants affect health outcomes in older adults?"
-            ],
-            "health": [
-                "What is the trajectory of cognitive decline in aging?",
-                "How do chronic conditions cluster in older adults?",
-                "What factors predict disability-free life expectancy?"
-            ],
-            "economic": [
-                "How does wealth accumulation vary across cohorts?",
-                "What is the relationship between pension adequacy and well-being?",
-                "How does retirement affect health and cognitive function?"
-            ],
-            "mental_health": [
-                "What are the prevalence and predictors of depression in older age?",
-                "How does social isolation affect mental health trajectories?",
-                "What role does social support play in resilience to life stressors?"
-            ],
-            "covid": [
-                "How did COVID-19 affect mental health in older adults?",
-                "What were the health behavior changes during the pandemic?",
-                "How did social isolation during lockdowns affect cognitive function?"
-            ],
-            "biomarkers": [
-                "How do biological markers relate to subjective health ratings?",
-                "What is the relationship between inflammation and cognitive aging?",
-                "How do health behaviors affect biomarker profiles?"
-            ]
-        }
+    comparison = {
+        "waves_compared": waves,
+        "comparison": {}
+    }
 
-        examples = research_examples.get(topic.lower(), research_examples["general"])
-
-        result = {
-            "topic": topic,
-            "research_questions": examples,
-            "data_strengths": [
-                "Longitudinal design allows for causal inference",
-                "Rich multidimensional data (health, economic, social)",
-                "Biomarker data in selected waves",
-                "Large representative sample of English adults 50+",
-                "Long follow-up period (1998-2024)"
-            ],
-            "analysis_possibilities": [
-                "Longitudinal modeling of change over time",
-                "Cross-sectional comparisons across age groups",
-                "Life course epidemiology",
-                "Health inequality research",
-                "Policy evaluation studies"
-            ]
-        }
+    for wave in waves:
+        if wave not in ELSA_WAVES:
+            comparison["comparison"][wave] = {"error": "Wave not found"}
+            continue
+
+        wave_data = ELSA_WAVES[wave]
+
+        if focus == "all" or focus == "topics":
+            comparison["comparison"][wave] = {
+                "name": wave_data["name"],
+                "year": wave_data["year"],
+                "key_topics": wave_data["key_topics"]
+            }
+
+        if focus == "all" or focus == "sample_size":
+            if wave not in comparison["comparison"]:
+                comparison["comparison"][wave] = {}
+            comparison["comparison"][wave]["sample_size"] = wave_data["sample_size"]
+            comparison["comparison"][wave]["fieldwork_period"] = wave_data["fieldwork_period"]
+
+    return [types.TextContent(
+        type="text",
+        text=dumps(comparison)
+    )]
+
+
+async def _handle_get_research_examples(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Return example research questions for a topic."""
+    topic = arguments.get("topic", "general")
+
+    research_examples = {
+        "general": [
+            "How does health change with age in the English population?",
+            "What are the predictors of successful aging?",
+            "How do social determinants affect health outcomes in older adults?"
+        ],
+        "health": [
+            "What is the trajectory of cognitive decline in aging?",
+            "How do chronic conditions cluster in older adults?",
+            "What factors predict disability-free life expectancy?"
+        ],
+        "economic": [
+            "How does wealth accumulation vary across cohorts?",
+            "What is the relationship between pension adequacy and well-being?",
+            "How does retirement affect health and cognitive function?"
+        ],
+        "mental_health": [
+            "What are the prevalence and predictors of depression in older age?",
+            "How does social isolation affect mental health trajectories?",
+            "What role does social support play in resilience to life stressors?"
+        ],
+        "covid": [
+            "How did COVID-19 affect mental health in older adults?",
+            "What were the health behavior changes during the pandemic?",
+            "How did social isolation during lockdowns affect cognitive function?"
+        ],
+        "biomarkers": [
+            "How do biological markers relate to subjective health ratings?",
+            "What is the relationship between inflammation and cognitive aging?",
+            "How do health behaviors affect biomarker profiles?"
+        ]
+    }
+
+    examples = research_examples.get(topic.lower(), research_examples["general"])
+
+    result = {
+        "topic": topic,
+        "research_questions": examples,
+        "data_strengths": [
+            "Longitudinal design allows for causal inference",
+            "Rich multidimensional data (health, economic, social)",
+            "Biomarker data in selected waves",
+            "Large representative sample of English adults 50+",
+            "Long follow-up period (1998-2024)"
+        ],
+        "analysis_possibilities": [
+            "Longitudinal modeling of change over time",
+            "Cross-sectional comparisons across age groups",
+            "Life course epidemiology",
+            "Health inequality research",
+            "Policy evaluation studies"
+        ]
+    }
+
+    return [types.TextContent(
+        type="text",
+        text=dumps(result)
+    )]
+
+
+# Tool name -> handler; call_tool dispatches with a single lookup
+TOOL_HANDLERS = {
+    "list_elsa_waves": _handle_list_elsa_waves,
+    "get_wave_details": _handle_get_wave_details,
+    "search_data_modules": _handle_search_data_modules,
+    "get_data_module_info": _handle_get_data_module_info,
+    "get_access_information": _handle_get_access_information,
+    "get_study_metadata": _handle_get_study_metadata,
+    "get_documentation_links": _handle_get_documentation_links,
+    "compare_waves": _handle_compare_waves,
+    "get_research_examples": _handle_get_research_examples,
+}
+
+
+@app.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: Any) -> list[types.TextContent]:
+    """Handle tool calls for ELSA data access."""
+
+    validate_arguments(VALIDATORS, name, arguments)
 
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return _error_response(f"Unknown tool: {name}")
 
-    else:
-        return [types.TextContent(
-            type="text",
-            text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2)
-        )]
+    return await handler(arguments)
 
 
 async def main():
@@ -721,4 +816,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -6,21 +6,38 @@ This MCP server provides tools to search and access ESHRE (European Society
 for Human Reproduction and Embryology) clinical guidelines and recommendations.
 """
 
-import os
 import asyncio
-from typing import Any, Optional
+import sys
+from pathlib import Path
+from typing import Any
 import httpx
-from bs4 import BeautifulSoup
 import re
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.cache import async_lru_cache
+from servers.event_loop import install_uvloop
+from servers.http_client import get_client, close_client, preconnect
+from servers.scraping import parse_html
+from servers.validation import compile_validators, validate_arguments
+
 # ESHRE URLs
 ESHRE_BASE_URL = "https://www.eshre.eu"
 GUIDELINES_URL = f"{ESHRE_BASE_URL}/Guidelines-and-Legal"
 
+# The guideline index changes rarely, so a scrape is reused for an hour
+LISTING_CACHE_TTL = 3600
+
+# Individual guideline pages are kept for a day
+CONTENT_CACHE_TTL = 86400
+CONTENT_CACHE_SIZE = 64
+
 # Create server instance
 server = Server("eshre-server")
 
@@ -35,12 +52,13 @@ async def fetch_page(url: str) -> str:
     Returns:
         HTML content as string
     """
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        response = await client.get(url, timeout=30.0)
-        response.raise_for_status()
-        return response.text
+    client = get_client()
+    response = await client.get(url, timeout=30.0, follow_redirects=True)
+    response.raise_for_status()
+    return response.text
 
 
+@async_lru_cache(maxsize=1, ttl=LISTING_CACHE_TTL)
 async def parse_guidelines_list() -> list[dict[str, Any]]:
     """
     Parse the guidelines page to extract available guidelines.
@@ -49,7 +67,7 @@ async def parse_guidelines_list() -> list[dict[str, Any]]:
         List of guidelines with title, URL, and description
     """
     html = await fetch_page(GUIDELINES_URL)
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     guidelines = []
 
@@ -145,6 +163,7 @@ async def search_guidelines(query: str) -> list[dict[str, Any]]:
     return matching_guidelines
 
 
+@async_lru_cache(maxsize=CONTENT_CACHE_SIZE, ttl=CONTENT_CACHE_TTL)
 async def get_guideline_content(url: str) -> dict[str, Any]:
     """
     Fetch the full content of a specific guideline document.
@@ -156,7 +175,7 @@ async def get_guideline_content(url: str) -> dict[str, Any]:
         Dictionary with title, content, metadata, and download links
     """
     html = await fetch_page(url)
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     # Extract title
     title_elem = soup.find('h1')
@@ -240,127 +259,155 @@ async def get_guideline_content(url: str) -> dict[str, Any]:
     }
 
 
+# Built once at import; handle_list_tools returns the same list each time
+TOOLS = [
+    types.Tool(
+        name="list_eshre_guidelines",
+        description="List all available ESHRE clinical guidelines and recommendations",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+    ),
+    types.Tool(
+        name="search_eshre_guidelines",
+        description="Search ESHRE guidelines by keyword or topic (e.g., 'endometriosis', 'IVF', 'PCOS', 'fertility preservation')",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'endometriosis', 'IVF', 'PCOS', 'fertility')"
+                }
+            },
+            "required": ["query"]
+        },
+    ),
+    types.Tool(
+        name="get_eshre_guideline",
+        description="Retrieve the full content and download links for a specific ESHRE guideline by URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "Full URL of the guideline document"
+                }
+            },
+            "required": ["url"]
+        },
+    ),
+]
+
+VALIDATORS = compile_validators(TOOLS)
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """
     List available tools.
     """
-    return [
-        types.Tool(
-            name="list_eshre_guidelines",
-            description="List all available ESHRE clinical guidelines and recommendations",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        ),
-        types.Tool(
-            name="search_eshre_guidelines",
-            description="Search ESHRE guidelines by keyword or topic (e.g., 'endometriosis', 'IVF', 'PCOS', 'fertility preservation')",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'endometriosis', 'IVF', 'PCOS', 'fertility')"
-                    }
-                },
-                "required": ["query"]
-            },
-        ),
-        types.Tool(
-            name="get_eshre_guideline",
-            description="Retrieve the full content and download links for a specific ESHRE guideline by URL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "Full URL of the guideline document"
-                    }
-                },
-                "required": ["url"]
-            },
-        ),
-    ]
+    return TOOLS
 
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """
-    Handle tool execution requests.
-    """
-    try:
-        if name == "list_eshre_guidelines":
-            guidelines = await parse_guidelines_list()
+async def _handle_list_eshre_guidelines(arguments: dict | None) -> list[types.TextContent]:
+    """List all ESHRE guidelines."""
+    guidelines = await parse_guidelines_list()
 
-            result = "# ESHRE Clinical Guidelines\n\n"
-            result += f"Found {len(guidelines)} clinical guidelines:\n\n"
+    parts = ["# ESHRE Clinical Guidelines\n\n"]
+    parts.append(f"Found {len(guidelines)} clinical guidelines:\n\n")
 
-            for i, guideline in enumerate(guidelines, 1):
-                result += f"{i}. **{guideline['title']}**\n"
-                if guideline['description']:
-                    result += f"   {guideline['description']}\n"
-                result += f"   URL: {guideline['url']}\n\n"
+    for i, guideline in enumerate(guidelines, 1):
+        parts.append(f"{i}. **{guideline['title']}**\n")
+        if guideline['description']:
+            parts.append(f"   {guideline['description']}\n")
+        parts.append(f"   URL: {guideline['url']}\n\n")
 
-            return [types.TextContent(type="text", text=result)]
+    return [types.TextContent(type="text", text="".join(parts))]
 
-        elif name == "search_eshre_guidelines":
-            if not arguments or "query" not in arguments:
-                raise ValueError("query parameter is required")
 
-            query = arguments["query"]
-            results = await search_guidelines(query)
+async def _handle_search_eshre_guidelines(arguments: dict | None) -> list[types.TextContent]:
+    """Search ESHRE guidelines by keyword."""
+    if not arguments or "query" not in arguments:
+        raise ValueError("query parameter is required")
 
-            result = f"# Search Results for '{query}'\n\n"
-            result += f"Found {len(results)} matching guidelines:\n\n"
+    query = arguments["query"]
+    results = await search_guidelines(query)
 
-            for i, guideline in enumerate(results, 1):
-                result += f"{i}. **{guideline['title']}**\n"
-                if guideline['description']:
-                    result += f"   {guideline['description']}\n"
-                result += f"   URL: {guideline['url']}\n\n"
+    parts = [f"# Search Results for '{query}'\n\n"]
+    parts.append(f"Found {len(results)} matching guidelines:\n\n")
 
-            if not results:
-                result += "No guidelines found matching your query.\n"
-                result += "Try different keywords or browse all guidelines using list_eshre_guidelines.\n"
+    for i, guideline in enumerate(results, 1):
+        parts.append(f"{i}. **{guideline['title']}**\n")
+        if guideline['description']:
+            parts.append(f"   {guideline['description']}\n")
+        parts.append(f"   URL: {guideline['url']}\n\n")
 
-            return [types.TextContent(type="text", text=result)]
+    if not results:
+        parts.append("No guidelines found matching your query.\n")
+        parts.append("Try different keywords or browse all guidelines using list_eshre_guidelines.\n")
 
-        elif name == "get_eshre_guideline":
-            if not arguments or "url" not in arguments:
-                raise ValueError("url parameter is required")
+    return [types.TextContent(type="text", text="".join(parts))]
 
-            url = arguments["url"]
-            content = await get_guideline_content(url)
 
-            result = f"# {content['title']}\n\n"
-            result += f"**URL:** {content['url']}\n"
-            if content['date']:
-                result += f"**Published:** {content['date']}\n"
-            result += f"**Word Count:** {content['word_count']}\n\n"
+async def _handle_get_eshre_guideline(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch and format the content of one guideline."""
+    if not arguments or "url" not in arguments:
+        raise ValueError("url parameter is required")
 
-            if content['downloads']:
-                result += "## Downloads\n\n"
-                for dl in content['downloads']:
-                    result += f"- [{dl['title']}]({dl['url']})\n"
-                result += "\n"
+    url = arguments["url"]
+    content = await get_guideline_content(url)
 
-            result += "---\n\n"
-            result += content['content']
+    parts = [f"# {content['title']}\n\n"]
+    parts.append(f"**URL:** {content['url']}\n")
+    if content['date']:
+        parts.append(f"**Published:** {content['date']}\n")
+    parts.append(f"**Word Count:** {content['word_count']}\n\n")
 
-            return [types.TextContent(type="text", text=result)]
+    if content['downloads']:
+        parts.append("## Downloads\n\n")
+        for dl in content['downloads']:
+            parts.append(f"- [{dl['title']}]({dl['url']})\n")
+        parts.append("\n")
 
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+    parts.append("---\n\n")
+    parts.append(content['content'])
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+# Tool name -> handler; handle_call_tool dispatches with a single lookup
+TOOL_HANDLERS = {
+    "list_eshre_guidelines": _handle_list_eshre_guidelines,
+    "search_eshre_guidelines": _handle_search_eshre_guidelines,
+    "get_eshre_guideline": _handle_get_eshre_guideline,
+}
+
+
+@server.call_tool(validate_input=False)
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests.
 
-    except Exception as e:
+    Bad arguments and upstream HTTP failures are reported as tool output,
+    tagged with the exception type; anything else propagates to the MCP
+    framework as an error result.
+    """
+    validate_arguments(VALIDATORS, name, arguments)
+
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    try:
+        return await handler(arguments)
+    except (ValueError, KeyError, httpx.HTTPError, asyncio.TimeoutError) as e:
         return [types.TextContent(
             type="text",
-            text=f"Error executing {name}: {str(e)}"
+            text=f"Error executing {name} ({type(e).__name__}): {str(e)}"
         )]
 
 
@@ -368,20 +415,26 @@ async def main():
     """
     Main entry point for the ESHRE MCP server.
     """
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="eshre-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    warmup = asyncio.create_task(preconnect(GUIDELINES_URL))
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="eshre-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        warmup.cancel()
+        await close_client()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
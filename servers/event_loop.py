@@ -0,0 +1,27 @@
+"""
+Event loop setup for the MCP server entry points.
+
+The servers spend most of their time waiting on HTTP responses and the
+stdio stream. uvloop's libuv-based loop handles that I/O noticeably faster
+than the default asyncio loop, so it is used when installed.
+"""
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the default event loop policy if it is available.
+
+    Must be called before the server starts its event loop.
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup, not on Windows
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
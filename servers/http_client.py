@@ -0,0 +1,77 @@
+"""
+Shared HTTP client for the MCP server modules.
+
+Opening a fresh httpx.AsyncClient per request means a new TCP/TLS handshake
+every time. The servers call the same handful of hosts (NCBI, the society
+guideline sites, the SART calculator) over and over, so a single pooled
+client per event loop keeps those connections warm.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # Required by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - falls back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 30.0
+
+# Warm-up requests are best effort and should never hold up the server
+PRECONNECT_TIMEOUT = 5.0
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient, creating it on first use.
+
+    The client is bound to the running event loop; if the loop has changed
+    (e.g. between test cases) a new client is created. HTTP/2 is negotiated
+    when the h2 package is installed, so concurrent requests to one host
+    share a single multiplexed connection.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client if it is open."""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+async def preconnect(*urls: str) -> None:
+    """
+    Open pooled connections to the given hosts before the first tool call.
+
+    Sends a HEAD request to each URL so DNS lookup and the TLS handshake are
+    done up front. Failures are ignored; the first real request then simply
+    connects as usual.
+
+    Args:
+        urls: URLs on the hosts the server will call
+    """
+    client = get_client()
+    await asyncio.gather(
+        *(client.head(url, timeout=PRECONNECT_TIMEOUT) for url in urls),
+        return_exceptions=True,
+    )
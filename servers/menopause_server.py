@@ -7,13 +7,21 @@ Estimates menopause age based on genetics, lifestyle, and health factors.
 """
 
 import asyncio
-import json
+import sys
+from pathlib import Path
 from typing import Any
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.event_loop import install_uvloop
+from servers.validation import compile_validators, validate_arguments
+
 
 # Create server instance
 server = Server("menopause-calculator")
@@ -156,13 +164,11 @@ def calculate_menopause_age(
     }
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available tools."""
-    return [
-        types.Tool(
-            name="calculate_menopause_age",
-            description="""Calculate estimated menopause age based on genetics, lifestyle, and health factors.
+# The calculator's tool schema is fixed, so it is built once at import
+TOOLS = [
+    types.Tool(
+        name="calculate_menopause_age",
+        description="""Calculate estimated menopause age based on genetics, lifestyle, and health factors.
 
 Based on research showing:
 - Typical menopause age: 51 years
@@ -171,111 +177,88 @@ Based on research showing:
 - BMI, exercise, and stress also influence timing
 
 This calculator provides an educational estimate. Always consult healthcare professionals for medical advice.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "current_age": {
-                        "type": "integer",
-                        "description": "Current age in years (typically 30-60)",
-                        "minimum": 30,
-                        "maximum": 65
-                    },
-                    "mothers_menopause_age": {
-                        "type": "integer",
-                        "description": "Age when mother reached menopause (optional, but strongest predictor)",
-                        "minimum": 35,
-                        "maximum": 65
-                    },
-                    "smoking_status": {
-                        "type": "string",
-                        "enum": ["never", "former", "current"],
-                        "description": "Smoking history",
-                        "default": "never"
-                    },
-                    "bmi": {
-                        "type": "number",
-                        "description": "Body Mass Index (optional)",
-                        "minimum": 15,
-                        "maximum": 50
-                    },
-                    "exercise_frequency": {
-                        "type": "string",
-                        "enum": ["low", "moderate", "high"],
-                        "description": "Exercise frequency",
-                        "default": "moderate"
-                    },
-                    "stress_level": {
-                        "type": "string",
-                        "enum": ["low", "moderate", "high"],
-                        "description": "Overall stress level",
-                        "default": "moderate"
-                    },
-                    "cycle_changes": {
-                        "type": "boolean",
-                        "description": "Currently experiencing menstrual cycle changes",
-                        "default": False
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "current_age": {
+                    "type": "integer",
+                    "description": "Current age in years (typically 30-60)",
+                    "minimum": 30,
+                    "maximum": 65
                 },
-                "required": ["current_age"]
-            }
-        )
-    ]
-
+                "mothers_menopause_age": {
+                    "type": "integer",
+                    "description": "Age when mother reached menopause (optional, but strongest predictor)",
+                    "minimum": 35,
+                    "maximum": 65
+                },
+                "smoking_status": {
+                    "type": "string",
+                    "enum": ["never", "former", "current"],
+                    "description": "Smoking history",
+                    "default": "never"
+                },
+                "bmi": {
+                    "type": "number",
+                    "description": "Body Mass Index (optional)",
+                    "minimum": 15,
+                    "maximum": 50
+                },
+                "exercise_frequency": {
+                    "type": "string",
+                    "enum": ["low", "moderate", "high"],
+                    "description": "Exercise frequency",
+                    "default": "moderate"
+                },
+                "stress_level": {
+                    "type": "string",
+                    "enum": ["low", "moderate", "high"],
+                    "description": "Overall stress level",
+                    "default": "moderate"
+                },
+                "cycle_changes": {
+                    "type": "boolean",
+                    "description": "Currently experiencing menstrual cycle changes",
+                    "default": False
+                }
+            },
+            "required": ["current_age"]
+        }
+    )
+]
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """Handle tool execution requests."""
+VALIDATORS = compile_validators(TOOLS)
 
-    if name != "calculate_menopause_age":
-        raise ValueError(f"Unknown tool: {name}")
 
-    if not arguments:
-        raise ValueError("Missing arguments")
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available tools."""
+    return TOOLS
 
-    # Extract parameters
-    current_age = arguments.get("current_age")
-    mothers_age = arguments.get("mothers_menopause_age")
-    smoking = arguments.get("smoking_status", "never")
-    bmi = arguments.get("bmi")
-    exercise = arguments.get("exercise_frequency", "moderate")
-    stress = arguments.get("stress_level", "moderate")
-    cycle_changes = arguments.get("cycle_changes", False)
-
-    # Calculate menopause age
-    result = calculate_menopause_age(
-        current_age=current_age,
-        mothers_menopause_age=mothers_age,
-        smoking_status=smoking,
-        bmi=bmi,
-        exercise_frequency=exercise,
-        stress_level=stress,
-        cycle_changes=cycle_changes
-    )
 
-    # Format output
-    output = f"""Menopause Age Estimate
+def format_menopause_estimate(result: dict[str, Any]) -> str:
+    """Format a calculate_menopause_age result as the tool's text response."""
+    parts = [f"""Menopause Age Estimate
 
 📊 Estimated Menopause Age: {result['estimated_menopause_age']} years
 ⏳ Years Until Estimated Menopause: {result['years_until_menopause']} years
 👤 Your Current Age: {result['current_age']} years
 📈 Statistical Baseline: {result['baseline_age']} years
 
-"""
+"""]
 
     if result['adjustments']:
-        output += "🔍 Contributing Factors:\n"
+        parts.append("🔍 Contributing Factors:\n")
         for adj in result['adjustments']:
             sign = "+" if adj['adjustment'] > 0 else ""
-            output += f"  • {adj['factor']}: {sign}{adj['adjustment']} years ({adj['impact']} impact)\n"
-        output += "\n"
+            parts.append(f"  • {adj['factor']}: {sign}{adj['adjustment']} years ({adj['impact']} impact)\n")
+        parts.append("\n")
 
     if result['cycle_changes_note']:
-        output += f"⚠️ {result['cycle_changes_note']}\n\n"
+        parts.append(f"⚠️ {result['cycle_changes_note']}\n\n")
 
-    output += f"ℹ️ {result['disclaimer']}\n\n"
-    output += """📚 Key Information:
+    parts.append(f"ℹ️ {result['disclaimer']}\n\n")
+    parts.append("""📚 Key Information:
 • Menopause typically occurs between ages 45-58
 • 80% of women experience hot flashes
 • Perimenopause often begins years before final period
@@ -291,9 +274,52 @@ async def handle_call_tool(
 • Planning for bone health and fertility considerations
 
 Source: https://reverse.health/calculator/menopause-age-calculator
-"""
+""")
+
+    return "".join(parts)
+
+
+# Tool name -> (calculator, formatter, required arguments, optional arguments).
+# Optional arguments the client leaves out fall back to the calculator's defaults.
+CALCULATORS = {
+    "calculate_menopause_age": (
+        calculate_menopause_age,
+        format_menopause_estimate,
+        ("current_age",),
+        (
+            "mothers_menopause_age",
+            "smoking_status",
+            "bmi",
+            "exercise_frequency",
+            "stress_level",
+            "cycle_changes",
+        ),
+    ),
+}
+
+
+@server.call_tool(validate_input=False)
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """Handle tool execution requests."""
+
+    validate_arguments(VALIDATORS, name, arguments)
+
+    entry = CALCULATORS.get(name)
+    if entry is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    calculator, formatter, required, optional = entry
+    kwargs = {key: arguments[key] for key in required}
+    kwargs.update((key, arguments[key]) for key in optional if key in arguments)
+
+    result = calculator(**kwargs)
 
-    return [types.TextContent(type="text", text=output)]
+    return [types.TextContent(type="text", text=formatter(result))]
 
 
 async def main():
@@ -314,4 +340,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
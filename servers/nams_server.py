@@ -6,22 +6,39 @@ This MCP server provides tools to search and access NAMS (North American Menopau
 now The Menopause Society) position statements, clinical guidelines, and treatment protocols.
 """
 
-import os
 import asyncio
+import sys
+from pathlib import Path
 from typing import Any, Optional
 import httpx
-from bs4 import BeautifulSoup
 import re
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.cache import async_lru_cache
+from servers.event_loop import install_uvloop
+from servers.http_client import get_client, close_client, preconnect
+from servers.scraping import parse_html
+from servers.validation import compile_validators, validate_arguments
+
 # NAMS URLs
 NAMS_BASE_URL = "https://www.menopause.org"
 POSITION_STATEMENTS_URL = f"{NAMS_BASE_URL}/publications/professional-publications/position-statements-other-reports"
 PROFESSIONAL_RESOURCES_URL = f"{NAMS_BASE_URL}/professional-resources"
 
+# The position statement index changes rarely, so a scrape is reused for an hour
+LISTING_CACHE_TTL = 3600
+
+# Individual protocol pages are kept for a day
+CONTENT_CACHE_TTL = 86400
+CONTENT_CACHE_SIZE = 64
+
 # Create server instance
 server = Server("nams-server")
 
@@ -45,10 +62,77 @@ async def fetch_page(url: str) -> str:
     Returns:
         HTML content as string
     """
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        response = await client.get(url, headers=HEADERS, timeout=30.0)
-        response.raise_for_status()
-        return response.text
+    client = get_client()
+    response = await client.get(url, headers=HEADERS, timeout=30.0, follow_redirects=True)
+    response.raise_for_status()
+    return response.text
+
+
+@async_lru_cache(maxsize=1, ttl=LISTING_CACHE_TTL)
+async def _scrape_position_statements() -> list[dict[str, Any]]:
+    """
+    Scrape the position statements page.
+
+    Errors propagate so that a failed scrape is not cached and the page is
+    retried on the next call.
+    """
+    html = await fetch_page(POSITION_STATEMENTS_URL)
+    soup = parse_html(html)
+
+    statements = []
+
+    # Find main content area
+    main_content = soup.find('main') or soup.find('div', class_=re.compile(r'content|main'))
+
+    if main_content:
+        # Look for position statement links
+        # These typically have specific patterns in NAMS site
+        links = main_content.find_all('a', href=True)
+
+        for link in links:
+            href = link.get('href', '')
+            text = link.get_text(strip=True)
+
+            # Skip navigation and empty links
+            if not text or len(text) < 15:
+                continue
+
+            # Look for PDF links and position statement pages
+            if '.pdf' in href.lower() or 'position' in href.lower() or 'statement' in text.lower():
+                # Get full URL
+                if href.startswith('/'):
+                    full_url = f"{NAMS_BASE_URL}{href}"
+                elif href.startswith('http'):
+                    full_url = href
+                else:
+                    continue
+
+                # Try to find description
+                description = ""
+                parent = link.find_parent(['div', 'article', 'section', 'p'])
+                if parent:
+                    # Get surrounding text
+                    parent_text = parent.get_text(strip=True)
+                    # Extract meaningful description (not just the title)
+                    if len(parent_text) > len(text) + 20:
+                        description = parent_text[:300]
+
+                statements.append({
+                    'title': text,
+                    'url': full_url,
+                    'description': description,
+                    'type': 'position_statement' if 'position' in text.lower() else 'clinical_guideline'
+                })
+
+    # Remove duplicates based on URL
+    seen_urls = set()
+    unique_statements = []
+    for stmt in statements:
+        if stmt['url'] not in seen_urls:
+            seen_urls.add(stmt['url'])
+            unique_statements.append(stmt)
+
+    return unique_statements
 
 
 async def parse_position_statements() -> list[dict[str, Any]]:
@@ -59,147 +143,97 @@ async def parse_position_statements() -> list[dict[str, Any]]:
         List of position statements with title, URL, and description
     """
     try:
-        html = await fetch_page(POSITION_STATEMENTS_URL)
-        soup = BeautifulSoup(html, 'html.parser')
-
-        statements = []
-
-        # Find main content area
-        main_content = soup.find('main') or soup.find('div', class_=re.compile(r'content|main'))
-
-        if main_content:
-            # Look for position statement links
-            # These typically have specific patterns in NAMS site
-            links = main_content.find_all('a', href=True)
-
-            for link in links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-
-                # Skip navigation and empty links
-                if not text or len(text) < 15:
-                    continue
-
-                # Look for PDF links and position statement pages
-                if '.pdf' in href.lower() or 'position' in href.lower() or 'statement' in text.lower():
-                    # Get full URL
-                    if href.startswith('/'):
-                        full_url = f"{NAMS_BASE_URL}{href}"
-                    elif href.startswith('http'):
-                        full_url = href
-                    else:
-                        continue
-
-                    # Try to find description
-                    description = ""
-                    parent = link.find_parent(['div', 'article', 'section', 'p'])
-                    if parent:
-                        # Get surrounding text
-                        parent_text = parent.get_text(strip=True)
-                        # Extract meaningful description (not just the title)
-                        if len(parent_text) > len(text) + 20:
-                            description = parent_text[:300]
-
-                    statements.append({
-                        'title': text,
-                        'url': full_url,
-                        'description': description,
-                        'type': 'position_statement' if 'position' in text.lower() else 'clinical_guideline'
-                    })
-
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_statements = []
-        for stmt in statements:
-            if stmt['url'] not in seen_urls:
-                seen_urls.add(stmt['url'])
-                unique_statements.append(stmt)
-
-        return unique_statements
-
-    except Exception as e:
+        return await _scrape_position_statements()
+    except Exception:
         # Return fallback list of known position statements
         return get_known_position_statements()
 
 
+# Curated fallback used when the NAMS site blocks scraping
+KNOWN_POSITION_STATEMENTS = [
+    {
+        'title': '2022 Hormone Therapy Position Statement',
+        'url': 'https://menopause.org/wp-content/uploads/professional/nams-2022-hormone-therapy-position-statement.pdf',
+        'description': 'The 2022 Hormone Therapy Position Statement provides the most up-to-date, scientifically based information on hormone therapy for menopausal symptoms.',
+        'type': 'position_statement',
+        'year': '2022',
+        'topic': 'hormone therapy'
+    },
+    {
+        'title': 'Recommendations for Clinical Care of Midlife Women',
+        'url': 'https://www.menopause.org/docs/default-source/2014/nams-recomm-for-clinical-care.pdf',
+        'description': 'Clinical care recommendations for midlife women covering various aspects of menopause management.',
+        'type': 'clinical_guideline',
+        'topic': 'general care'
+    },
+    {
+        'title': 'Nonhormonal Management of Menopause-Associated Vasomotor Symptoms',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/nonhormonal-management',
+        'description': 'Position statement on nonhormonal approaches to managing hot flashes and night sweats.',
+        'type': 'position_statement',
+        'topic': 'vasomotor symptoms'
+    },
+    {
+        'title': 'Management of Osteoporosis in Postmenopausal Women',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/osteoporosis',
+        'description': 'Guidelines for prevention and treatment of osteoporosis in postmenopausal women.',
+        'type': 'position_statement',
+        'topic': 'osteoporosis'
+    },
+    {
+        'title': 'Genitourinary Syndrome of Menopause',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/genitourinary-syndrome',
+        'description': 'Position statement on diagnosis and treatment of genitourinary symptoms of menopause.',
+        'type': 'position_statement',
+        'topic': 'genitourinary'
+    },
+    {
+        'title': 'Treatment of Symptoms of the Menopause',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/treatment-symptoms',
+        'description': 'Comprehensive position statement on evidence-based treatment approaches for menopausal symptoms.',
+        'type': 'position_statement',
+        'topic': 'symptom management'
+    },
+    {
+        'title': 'Cardiovascular Disease and Menopause',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/cardiovascular-disease',
+        'description': 'Position statement on cardiovascular health in menopausal women.',
+        'type': 'position_statement',
+        'topic': 'cardiovascular'
+    },
+    {
+        'title': 'Role of Progestogen in Hormone Therapy',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/progestogen-hormone-therapy',
+        'description': 'Clinical guidance on the use of progestogens in hormone therapy.',
+        'type': 'clinical_guideline',
+        'topic': 'hormone therapy'
+    },
+    {
+        'title': 'Bioidentical Hormone Therapy',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/bioidentical-hormone-therapy',
+        'description': 'Position statement on bioidentical hormones and compounded hormone therapy.',
+        'type': 'position_statement',
+        'topic': 'hormone therapy'
+    },
+    {
+        'title': 'Management of Symptomatic Vulvovaginal Atrophy',
+        'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/vulvovaginal-atrophy',
+        'description': 'Clinical recommendations for managing vulvovaginal atrophy in postmenopausal women.',
+        'type': 'clinical_guideline',
+        'topic': 'genitourinary'
+    },
+]
+
+
 def get_known_position_statements() -> list[dict[str, Any]]:
     """
     Return a curated list of known NAMS position statements.
     This serves as a fallback when web scraping is blocked.
+
+    The list is shared between calls, so callers must copy it before
+    modifying it.
     """
-    return [
-        {
-            'title': '2022 Hormone Therapy Position Statement',
-            'url': 'https://menopause.org/wp-content/uploads/professional/nams-2022-hormone-therapy-position-statement.pdf',
-            'description': 'The 2022 Hormone Therapy Position Statement provides the most up-to-date, scientifically based information on hormone therapy for menopausal symptoms.',
-            'type': 'position_statement',
-            'year': '2022',
-            'topic': 'hormone therapy'
-        },
-        {
-            'title': 'Recommendations for Clinical Care of Midlife Women',
-            'url': 'https://www.menopause.org/docs/default-source/2014/nams-recomm-for-clinical-care.pdf',
-            'description': 'Clinical care recommendations for midlife women covering various aspects of menopause management.',
-            'type': 'clinical_guideline',
-            'topic': 'general care'
-        },
-        {
-            'title': 'Nonhormonal Management of Menopause-Associated Vasomotor Symptoms',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/nonhormonal-management',
-            'description': 'Position statement on nonhormonal approaches to managing hot flashes and night sweats.',
-            'type': 'position_statement',
-            'topic': 'vasomotor symptoms'
-        },
-        {
-            'title': 'Management of Osteoporosis in Postmenopausal Women',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/osteoporosis',
-            'description': 'Guidelines for prevention and treatment of osteoporosis in postmenopausal women.',
-            'type': 'position_statement',
-            'topic': 'osteoporosis'
-        },
-        {
-            'title': 'Genitourinary Syndrome of Menopause',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/genitourinary-syndrome',
-            'description': 'Position statement on diagnosis and treatment of genitourinary symptoms of menopause.',
-            'type': 'position_statement',
-            'topic': 'genitourinary'
-        },
-        {
-            'title': 'Treatment of Symptoms of the Menopause',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/treatment-symptoms',
-            'description': 'Comprehensive position statement on evidence-based treatment approaches for menopausal symptoms.',
-            'type': 'position_statement',
-            'topic': 'symptom management'
-        },
-        {
-            'title': 'Cardiovascular Disease and Menopause',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/cardiovascular-disease',
-            'description': 'Position statement on cardiovascular health in menopausal women.',
-            'type': 'position_statement',
-            'topic': 'cardiovascular'
-        },
-        {
-            'title': 'Role of Progestogen in Hormone Therapy',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/progestogen-hormone-therapy',
-            'description': 'Clinical guidance on the use of progestogens in hormone therapy.',
-            'type': 'clinical_guideline',
-            'topic': 'hormone therapy'
-        },
-        {
-            'title': 'Bioidentical Hormone Therapy',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/bioidentical-hormone-therapy',
-            'description': 'Position statement on bioidentical hormones and compounded hormone therapy.',
-            'type': 'position_statement',
-            'topic': 'hormone therapy'
-        },
-        {
-            'title': 'Management of Symptomatic Vulvovaginal Atrophy',
-            'url': f'{NAMS_BASE_URL}/publications/clinical-practice-materials/vulvovaginal-atrophy',
-            'description': 'Clinical recommendations for managing vulvovaginal atrophy in postmenopausal women.',
-            'type': 'clinical_guideline',
-            'topic': 'genitourinary'
-        },
-    ]
+    return KNOWN_POSITION_STATEMENTS
 
 
 async def search_protocols(query: str, topic: Optional[str] = None) -> list[dict[str, Any]]:
@@ -214,7 +248,7 @@ async def search_protocols(query: str, topic: Optional[str] = None) -> list[dict
         List of matching documents
     """
     # Get all statements (try web scraping first, fall back to known list)
-    all_docs = await parse_position_statements()
+    all_docs = list(await parse_position_statements())
 
     # If web scraping failed or returned few results, supplement with known statements
     if len(all_docs) < 5:
@@ -245,6 +279,7 @@ async def search_protocols(query: str, topic: Optional[str] = None) -> list[dict
     return matching_docs
 
 
+@async_lru_cache(maxsize=CONTENT_CACHE_SIZE, ttl=CONTENT_CACHE_TTL)
 async def get_protocol_content(url: str) -> dict[str, Any]:
     """
     Fetch the full content of a specific NAMS protocol or position statement.
@@ -266,7 +301,7 @@ async def get_protocol_content(url: str) -> dict[str, Any]:
         }
 
     html = await fetch_page(url)
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
 
     # Extract title
     title_elem = soup.find('h1')
@@ -316,184 +351,215 @@ async def get_protocol_content(url: str) -> dict[str, Any]:
     }
 
 
+# Static tool definitions, shared by every list_tools request
+TOOLS = [
+    types.Tool(
+        name="list_nams_position_statements",
+        description="List available NAMS position statements and clinical guidelines on menopause management",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+    ),
+    types.Tool(
+        name="search_nams_protocols",
+        description="Search NAMS position statements and protocols by keyword or topic (e.g., 'hormone therapy', 'osteoporosis', 'vasomotor symptoms')",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'hormone therapy', 'hot flashes', 'bone health')"
+                },
+                "topic": {
+                    "type": "string",
+                    "description": "Optional topic filter (e.g., 'hormone therapy', 'cardiovascular', 'genitourinary')"
+                }
+            },
+            "required": ["query"]
+        },
+    ),
+    types.Tool(
+        name="get_protocol_content",
+        description="Retrieve the full content of a specific NAMS protocol or position statement by URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "Full URL of the protocol or position statement"
+                }
+            },
+            "required": ["url"]
+        },
+    ),
+    types.Tool(
+        name="list_nams_topics",
+        description="List common topics covered by NAMS position statements",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+    ),
+]
+
+VALIDATORS = compile_validators(TOOLS)
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """
     List available tools.
     """
-    return [
-        types.Tool(
-            name="list_nams_position_statements",
-            description="List available NAMS position statements and clinical guidelines on menopause management",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        ),
-        types.Tool(
-            name="search_nams_protocols",
-            description="Search NAMS position statements and protocols by keyword or topic (e.g., 'hormone therapy', 'osteoporosis', 'vasomotor symptoms')",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'hormone therapy', 'hot flashes', 'bone health')"
-                    },
-                    "topic": {
-                        "type": "string",
-                        "description": "Optional topic filter (e.g., 'hormone therapy', 'cardiovascular', 'genitourinary')"
-                    }
-                },
-                "required": ["query"]
-            },
-        ),
-        types.Tool(
-            name="get_protocol_content",
-            description="Retrieve the full content of a specific NAMS protocol or position statement by URL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "Full URL of the protocol or position statement"
-                    }
-                },
-                "required": ["url"]
-            },
-        ),
-        types.Tool(
-            name="list_nams_topics",
-            description="List common topics covered by NAMS position statements",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        ),
+    return TOOLS
+
+
+async def _handle_list_nams_position_statements(arguments: dict | None) -> list[types.TextContent]:
+    """List NAMS position statements, topped up with known statements."""
+    statements = list(await parse_position_statements())
+
+    # Supplement with known statements if needed
+    if len(statements) < 5:
+        known = get_known_position_statements()
+        seen_urls = {s['url'] for s in statements}
+        for stmt in known:
+            if stmt['url'] not in seen_urls:
+                statements.append(stmt)
+
+    parts = ["# NAMS Position Statements & Clinical Guidelines\n\n"]
+    parts.append(f"Found {len(statements)} position statements and guidelines:\n\n")
+
+    for i, stmt in enumerate(statements, 1):
+        parts.append(f"{i}. **{stmt['title']}**\n")
+        if stmt.get('topic'):
+            parts.append(f"   Topic: {stmt['topic']}\n")
+        if stmt.get('description'):
+            parts.append(f"   {stmt['description']}\n")
+        parts.append(f"   Type: {stmt['type']}\n")
+        parts.append(f"   URL: {stmt['url']}\n\n")
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_search_nams_protocols(arguments: dict | None) -> list[types.TextContent]:
+    """Search NAMS documents by keyword and optional topic."""
+    if not arguments or "query" not in arguments:
+        raise ValueError("query parameter is required")
+
+    query = arguments["query"]
+    topic = arguments.get("topic")
+
+    results = await search_protocols(query, topic)
+
+    parts = [f"# Search Results for '{query}'\n\n"]
+
+    if topic:
+        parts.append(f"Topic filter: {topic}\n\n")
+
+    parts.append(f"Found {len(results)} matching documents:\n\n")
+
+    for i, doc in enumerate(results, 1):
+        parts.append(f"{i}. **{doc['title']}**\n")
+        parts.append(f"   Type: {doc['type']}\n")
+        if doc.get('topic'):
+            parts.append(f"   Topic: {doc['topic']}\n")
+        if doc.get('description'):
+            parts.append(f"   {doc['description']}\n")
+        parts.append(f"   URL: {doc['url']}\n\n")
+
+    if not results:
+        parts.append("No documents found matching your query.\n")
+        parts.append("Try different keywords or browse all documents using list_nams_position_statements.\n")
+        parts.append("\nCommon topics: hormone therapy, vasomotor symptoms, osteoporosis, cardiovascular, genitourinary\n")
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_get_protocol_content(arguments: dict | None) -> list[types.TextContent]:
+    """Fetch and format the content of one NAMS document."""
+    if not arguments or "url" not in arguments:
+        raise ValueError("url parameter is required")
+
+    url = arguments["url"]
+    content = await get_protocol_content(url)
+
+    parts = [f"# {content['title']}\n\n"]
+    parts.append(f"**URL:** {content['url']}\n")
+    parts.append(f"**Content Type:** {content['content_type']}\n")
+    if content.get('date'):
+        parts.append(f"**Date:** {content['date']}\n")
+    if content['word_count'] > 0:
+        parts.append(f"**Word Count:** {content['word_count']}\n")
+    parts.append("\n---\n\n")
+    parts.append(content['content'])
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_list_nams_topics(arguments: dict | None) -> list[types.TextContent]:
+    """List the topics NAMS position statements commonly cover."""
+    topics = [
+        "Hormone Therapy",
+        "Vasomotor Symptoms (hot flashes, night sweats)",
+        "Genitourinary Syndrome of Menopause",
+        "Osteoporosis and Bone Health",
+        "Cardiovascular Health",
+        "Sexual Health",
+        "Mood and Cognitive Function",
+        "Sleep Disorders",
+        "Weight Management",
+        "Breast Health",
+        "Nonhormonal Therapies",
+        "Bioidentical Hormones",
+        "Premature Menopause",
+        "Complementary and Alternative Medicine"
     ]
 
+    parts = ["# Common Topics in NAMS Position Statements\n\n"]
+    parts.append("The following topics are commonly addressed in NAMS position statements:\n\n")
+
+    for i, topic in enumerate(topics, 1):
+        parts.append(f"{i}. {topic}\n")
+
+    parts.append("\nUse these topics to search for specific position statements with the search_nams_protocols tool.\n")
 
-@server.call_tool()
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+# Tool name -> handler; handle_call_tool dispatches with a single lookup
+TOOL_HANDLERS = {
+    "list_nams_position_statements": _handle_list_nams_position_statements,
+    "search_nams_protocols": _handle_search_nams_protocols,
+    "get_protocol_content": _handle_get_protocol_content,
+    "list_nams_topics": _handle_list_nams_topics,
+}
+
+
+@server.call_tool(validate_input=False)
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """
     Handle tool execution requests.
+
+    Bad arguments and upstream HTTP failures are reported as tool output,
+    tagged with the exception type; anything else propagates to the MCP
+    framework as an error result.
     """
+    validate_arguments(VALIDATORS, name, arguments)
+
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
     try:
-        if name == "list_nams_position_statements":
-            statements = await parse_position_statements()
-
-            # Supplement with known statements if needed
-            if len(statements) < 5:
-                known = get_known_position_statements()
-                seen_urls = {s['url'] for s in statements}
-                for stmt in known:
-                    if stmt['url'] not in seen_urls:
-                        statements.append(stmt)
-
-            result = "# NAMS Position Statements & Clinical Guidelines\n\n"
-            result += f"Found {len(statements)} position statements and guidelines:\n\n"
-
-            for i, stmt in enumerate(statements, 1):
-                result += f"{i}. **{stmt['title']}**\n"
-                if stmt.get('topic'):
-                    result += f"   Topic: {stmt['topic']}\n"
-                if stmt.get('description'):
-                    result += f"   {stmt['description']}\n"
-                result += f"   Type: {stmt['type']}\n"
-                result += f"   URL: {stmt['url']}\n\n"
-
-            return [types.TextContent(type="text", text=result)]
-
-        elif name == "search_nams_protocols":
-            if not arguments or "query" not in arguments:
-                raise ValueError("query parameter is required")
-
-            query = arguments["query"]
-            topic = arguments.get("topic")
-
-            results = await search_protocols(query, topic)
-
-            result = f"# Search Results for '{query}'\n\n"
-
-            if topic:
-                result += f"Topic filter: {topic}\n\n"
-
-            result += f"Found {len(results)} matching documents:\n\n"
-
-            for i, doc in enumerate(results, 1):
-                result += f"{i}. **{doc['title']}**\n"
-                result += f"   Type: {doc['type']}\n"
-                if doc.get('topic'):
-                    result += f"   Topic: {doc['topic']}\n"
-                if doc.get('description'):
-                    result += f"   {doc['description']}\n"
-                result += f"   URL: {doc['url']}\n\n"
-
-            if not results:
-                result += "No documents found matching your query.\n"
-                result += "Try different keywords or browse all documents using list_nams_position_statements.\n"
-                result += "\nCommon topics: hormone therapy, vasomotor symptoms, osteoporosis, cardiovascular, genitourinary\n"
-
-            return [types.TextContent(type="text", text=result)]
-
-        elif name == "get_protocol_content":
-            if not arguments or "url" not in arguments:
-                raise ValueError("url parameter is required")
-
-            url = arguments["url"]
-            content = await get_protocol_content(url)
-
-            result = f"# {content['title']}\n\n"
-            result += f"**URL:** {content['url']}\n"
-            result += f"**Content Type:** {content['content_type']}\n"
-            if content.get('date'):
-                result += f"**Date:** {content['date']}\n"
-            if content['word_count'] > 0:
-                result += f"**Word Count:** {content['word_count']}\n"
-            result += "\n---\n\n"
-            result += content['content']
-
-            return [types.TextContent(type="text", text=result)]
-
-        elif name == "list_nams_topics":
-            topics = [
-                "Hormone Therapy",
-                "Vasomotor Symptoms (hot flashes, night sweats)",
-                "Genitourinary Syndrome of Menopause",
-                "Osteoporosis and Bone Health",
-                "Cardiovascular Health",
-                "Sexual Health",
-                "Mood and Cognitive Function",
-                "Sleep Disorders",
-                "Weight Management",
-                "Breast Health",
-                "Nonhormonal Therapies",
-                "Bioidentical Hormones",
-                "Premature Menopause",
-                "Complementary and Alternative Medicine"
-            ]
-
-            result = "# Common Topics in NAMS Position Statements\n\n"
-            result += "The following topics are commonly addressed in NAMS position statements:\n\n"
-
-            for i, topic in enumerate(topics, 1):
-                result += f"{i}. {topic}\n"
-
-            result += "\nUse these topics to search for specific position statements with the search_nams_protocols tool.\n"
-
-            return [types.TextContent(type="text", text=result)]
-
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-
-    except Exception as e:
+        return await handler(arguments)
+    except (ValueError, KeyError, httpx.HTTPError, asyncio.TimeoutError) as e:
         return [types.TextContent(
             type="text",
-            text=f"Error executing {name}: {str(e)}"
+            text=f"Error executing {name} ({type(e).__name__}): {str(e)}"
         )]
 
 
@@ -501,20 +567,26 @@ async def main():
     """
     Main entry point for the NAMS MCP server.
     """
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="nams-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    warmup = asyncio.create_task(preconnect(NAMS_BASE_URL))
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="nams-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        warmup.cancel()
+        await close_client()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -8,14 +8,29 @@ and retrieve their content for analysis by Claude.
 
 import os
 import asyncio
-from typing import Any, Optional
-import httpx
-from xml.etree import ElementTree as ET
+import logging
+import sys
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Iterator
+from lxml import etree as ET
+from pydantic import BaseModel, Field, field_validator
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.cache import async_lru_cache
+from servers.event_loop import install_uvloop
+from servers.http_client import get_client, close_client, preconnect
+from servers.validation import compile_validators, validate_arguments
+
+logger = logging.getLogger("pubmed-server")
+
 # NCBI E-utilities base URLs
 ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
@@ -24,6 +39,42 @@ ESUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
 # Get API key from environment (optional but recommended for higher rate limits)
 NCBI_API_KEY = os.getenv("NCBI_API_KEY", "")
 
+# Published articles don't change, so fetched records are kept in memory by PMID
+ARTICLE_CACHE_SIZE = 4096
+
+# NCBI allows 3 requests/second without an API key and 10 with one
+REQUESTS_PER_SECOND = 10 if NCBI_API_KEY else 3
+MAX_CONCURRENT_FETCHES = 3
+
+# EFetch accepts up to 200 IDs per request
+EFETCH_BATCH_SIZE = 200
+
+# Upper bound on search_pubmed's max_results; larger requests are clamped
+MAX_SEARCH_RESULTS = 100
+
+
+class RateLimiter:
+    """
+    Space out request start times so no more than `rate` begin per second.
+
+    Each caller reserves the next free slot synchronously, so concurrent
+    tasks on the same event loop never race for a slot.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
 # Create server instance
 server = Server("pubmed-server")
 
@@ -44,35 +95,40 @@ async def search_pubmed(query: str, max_results: int = 10) -> dict[str, Any]:
         "term": query,
         "retmax": max_results,
         "retmode": "json",
+        "usehistory": "y",
     }
 
     if NCBI_API_KEY:
         params["api_key"] = NCBI_API_KEY
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(ESEARCH_URL, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-        # Check if the response has the expected structure
-        if "esearchresult" not in data:
-            raise ValueError(f"Unexpected API response structure: {data}")
-
-        esearch_result = data["esearchresult"]
-
-        # Check for API errors
-        if "ERROR" in esearch_result:
-            raise ValueError(f"PubMed API error: {esearch_result['ERROR']}")
-
-        # Get count and idlist with defaults
-        count = int(esearch_result.get("count", 0))
-        pmids = esearch_result.get("idlist", [])
-
-        return {
-            "count": count,
-            "pmids": pmids,
-            "query": query
-        }
+    client = get_client()
+    await rate_limiter.wait()
+    response = await client.get(ESEARCH_URL, params=params, timeout=30.0)
+    response.raise_for_status()
+    data = response.json()
+
+    # Check if the response has the expected structure
+    if "esearchresult" not in data:
+        raise ValueError(f"Unexpected API response structure: {data}")
+
+    esearch_result = data["esearchresult"]
+
+    # Check for API errors
+    if "ERROR" in esearch_result:
+        raise ValueError(f"PubMed API error: {esearch_result['ERROR']}")
+
+    # Get count and idlist with defaults
+    count = int(esearch_result.get("count", 0))
+    pmids = esearch_result.get("idlist", [])
+
+    return {
+        "count": count,
+        "pmids": pmids,
+        "query": query,
+        # History server handles so esummary can reuse this result set
+        "webenv": esearch_result.get("webenv", ""),
+        "query_key": esearch_result.get("querykey", ""),
+    }
 
 
 async def get_article_summaries(pmids: list[str]) -> list[dict[str, Any]]:
@@ -97,38 +153,212 @@ async def get_article_summaries(pmids: list[str]) -> list[dict[str, Any]]:
     if NCBI_API_KEY:
         params["api_key"] = NCBI_API_KEY
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(ESUMMARY_URL, params=params, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
-
-        # Check if the response has the expected structure
-        if "result" not in data:
-            raise ValueError(f"Unexpected API response structure: {data}")
-
-        # Check for API errors
-        if "error" in data:
-            raise ValueError(f"PubMed API error: {data['error']}")
-
-        summaries = []
-        for pmid in pmids:
-            if pmid in data["result"]:
-                article = data["result"][pmid]
-                # Skip error entries
-                if isinstance(article, dict) and "error" in article:
-                    continue
-                summaries.append({
-                    "pmid": pmid,
-                    "title": article.get("title", ""),
-                    "authors": [author.get("name", "") for author in article.get("authors", [])],
-                    "journal": article.get("fulljournalname", ""),
-                    "pubdate": article.get("pubdate", ""),
-                    "doi": article.get("elocationid", "").replace("doi: ", ""),
-                })
-
-        return summaries
+    client = get_client()
+    await rate_limiter.wait()
+    response = await client.get(ESUMMARY_URL, params=params, timeout=30.0)
+    response.raise_for_status()
+
+    return _parse_summaries(response.json(), pmids)
+
+
+async def get_article_summaries_by_history(
+    webenv: str, query_key: str, max_results: int = 10
+) -> list[dict[str, Any]]:
+    """
+    Get article summaries for a result set stored on the NCBI history server.
+
+    Uses the WebEnv/query_key returned by search_pubmed so the PMID list
+    does not have to be sent back in the request.
+
+    Args:
+        webenv: WebEnv value from search_pubmed
+        query_key: query_key value from search_pubmed
+        max_results: Maximum number of summaries to return
+
+    Returns:
+        List of article summaries in search order
+    """
+    params = {
+        "db": "pubmed",
+        "WebEnv": webenv,
+        "query_key": query_key,
+        "retmax": max_results,
+        "retmode": "json",
+    }
+
+    if NCBI_API_KEY:
+        params["api_key"] = NCBI_API_KEY
+
+    client = get_client()
+    await rate_limiter.wait()
+    response = await client.get(ESUMMARY_URL, params=params, timeout=30.0)
+    response.raise_for_status()
+    data = response.json()
 
+    return _parse_summaries(data, data.get("result", {}).get("uids", []))
 
+
+async def summarize_search(search_results: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Get summaries for a search_pubmed result, via the history server when possible.
+
+    Args:
+        search_results: Dictionary returned by search_pubmed
+
+    Returns:
+        List of article summaries
+    """
+    if not search_results["pmids"]:
+        return []
+
+    if search_results.get("webenv") and search_results.get("query_key"):
+        return await get_article_summaries_by_history(
+            search_results["webenv"],
+            search_results["query_key"],
+            len(search_results["pmids"]),
+        )
+
+    return await get_article_summaries(search_results["pmids"])
+
+
+def _parse_summaries(data: dict[str, Any], pmids: list[str]) -> list[dict[str, Any]]:
+    """Turn an esummary JSON response into article summaries ordered by pmids."""
+    # Check if the response has the expected structure
+    if "result" not in data:
+        raise ValueError(f"Unexpected API response structure: {data}")
+
+    # Check for API errors
+    if "error" in data:
+        raise ValueError(f"PubMed API error: {data['error']}")
+
+    summaries = []
+    for pmid in pmids:
+        if pmid in data["result"]:
+            article = data["result"][pmid]
+            # Skip error entries
+            if isinstance(article, dict) and "error" in article:
+                continue
+            summaries.append({
+                "pmid": pmid,
+                "title": article.get("title", ""),
+                "authors": [author.get("name", "") for author in article.get("authors", [])],
+                "journal": article.get("fulljournalname", ""),
+                "pubdate": article.get("pubdate", ""),
+                "doi": article.get("elocationid", "").replace("doi: ", ""),
+            })
+
+    return summaries
+
+
+def _empty_article(pmid: str) -> dict[str, Any]:
+    """Return an article record with every field blank."""
+    return {
+        "pmid": pmid,
+        "title": "",
+        "abstract": "",
+        "authors": [],
+        "journal": "",
+        "pubdate": "",
+        "doi": "",
+        "keywords": [],
+    }
+
+
+def _parse_article(article) -> dict[str, Any]:
+    """
+    Extract article details from a single PubmedArticle element.
+
+    Args:
+        article: PubmedArticle element
+
+    Returns:
+        Dictionary containing article details
+    """
+    pmid_elem = article.find(".//MedlineCitation/PMID")
+    article_data = _empty_article(pmid_elem.text if pmid_elem is not None and pmid_elem.text else "")
+
+    # Title
+    title_elem = article.find(".//ArticleTitle")
+    if title_elem is not None and title_elem.text:
+        article_data["title"] = title_elem.text
+
+    # Abstract
+    abstract_texts = article.findall(".//AbstractText")
+    if abstract_texts:
+        abstract_parts = []
+        for abstract_text in abstract_texts:
+            label = abstract_text.get("Label", "")
+            text = abstract_text.text or ""
+            if label:
+                abstract_parts.append(f"{label}: {text}")
+            else:
+                abstract_parts.append(text)
+        article_data["abstract"] = "\n\n".join(abstract_parts)
+
+    # Authors
+    authors = article.findall(".//Author")
+    for author in authors:
+        last_name = author.find("LastName")
+        fore_name = author.find("ForeName")
+        if last_name is not None and fore_name is not None:
+            article_data["authors"].append(f"{fore_name.text} {last_name.text}")
+
+    # Journal
+    journal = article.find(".//Journal/Title")
+    if journal is not None and journal.text:
+        article_data["journal"] = journal.text
+
+    # Publication date
+    pub_date = article.find(".//PubDate")
+    if pub_date is not None:
+        year = pub_date.find("Year")
+        month = pub_date.find("Month")
+        day = pub_date.find("Day")
+        date_parts = []
+        if year is not None and year.text:
+            date_parts.append(year.text)
+        if month is not None and month.text:
+            date_parts.append(month.text)
+        if day is not None and day.text:
+            date_parts.append(day.text)
+        article_data["pubdate"] = " ".join(date_parts)
+
+    # DOI
+    article_ids = article.findall(".//ArticleId")
+    for article_id in article_ids:
+        if article_id.get("IdType") == "doi":
+            article_data["doi"] = article_id.text or ""
+
+    # Keywords
+    keywords = article.findall(".//Keyword")
+    article_data["keywords"] = [kw.text for kw in keywords if kw.text]
+
+    return article_data
+
+
+def iter_pubmed_articles(xml_data: bytes) -> Iterator[dict[str, Any]]:
+    """
+    Parse an EFetch XML response one PubmedArticle at a time.
+
+    Each record is cleared once parsed so memory stays flat no matter how
+    many articles the response holds.
+
+    Args:
+        xml_data: Raw EFetch response body
+
+    Yields:
+        Dictionaries containing article details
+    """
+    for _, elem in ET.iterparse(
+        BytesIO(xml_data), events=("end",), tag="PubmedArticle", resolve_entities=False
+    ):
+        yield _parse_article(elem)
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+@async_lru_cache(maxsize=ARTICLE_CACHE_SIZE)
 async def fetch_article_abstract(pmid: str) -> dict[str, Any]:
     """
     Fetch full article details including abstract from PubMed.
@@ -148,279 +378,330 @@ async def fetch_article_abstract(pmid: str) -> dict[str, Any]:
     if NCBI_API_KEY:
         params["api_key"] = NCBI_API_KEY
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(EFETCH_URL, params=params, timeout=30.0)
-        response.raise_for_status()
-
-        # Parse XML response
-        root = ET.fromstring(response.text)
-
-        # Extract article information
-        article_data = {
-            "pmid": pmid,
-            "title": "",
-            "abstract": "",
-            "authors": [],
-            "journal": "",
-            "pubdate": "",
-            "doi": "",
-            "keywords": [],
-        }
-
-        # Find the article element
-        article = root.find(".//PubmedArticle")
-        if article is None:
-            return article_data
-
-        # Title
-        title_elem = article.find(".//ArticleTitle")
-        if title_elem is not None and title_elem.text:
-            article_data["title"] = title_elem.text
-
-        # Abstract
-        abstract_texts = article.findall(".//AbstractText")
-        if abstract_texts:
-            abstract_parts = []
-            for abstract_text in abstract_texts:
-                label = abstract_text.get("Label", "")
-                text = abstract_text.text or ""
-                if label:
-                    abstract_parts.append(f"{label}: {text}")
-                else:
-                    abstract_parts.append(text)
-            article_data["abstract"] = "\n\n".join(abstract_parts)
-
-        # Authors
-        authors = article.findall(".//Author")
-        for author in authors:
-            last_name = author.find("LastName")
-            fore_name = author.find("ForeName")
-            if last_name is not None and fore_name is not None:
-                article_data["authors"].append(f"{fore_name.text} {last_name.text}")
-
-        # Journal
-        journal = article.find(".//Journal/Title")
-        if journal is not None and journal.text:
-            article_data["journal"] = journal.text
-
-        # Publication date
-        pub_date = article.find(".//PubDate")
-        if pub_date is not None:
-            year = pub_date.find("Year")
-            month = pub_date.find("Month")
-            day = pub_date.find("Day")
-            date_parts = []
-            if year is not None and year.text:
-                date_parts.append(year.text)
-            if month is not None and month.text:
-                date_parts.append(month.text)
-            if day is not None and day.text:
-                date_parts.append(day.text)
-            article_data["pubdate"] = " ".join(date_parts)
-
-        # DOI
-        article_ids = article.findall(".//ArticleId")
-        for article_id in article_ids:
-            if article_id.get("IdType") == "doi":
-                article_data["doi"] = article_id.text or ""
-
-        # Keywords
-        keywords = article.findall(".//Keyword")
-        article_data["keywords"] = [kw.text for kw in keywords if kw.text]
+    client = get_client()
+    await rate_limiter.wait()
+    response = await client.get(EFETCH_URL, params=params, timeout=30.0)
+    response.raise_for_status()
 
+    # Stream the PubmedArticle records out of the response
+    for article_data in iter_pubmed_articles(response.content):
+        article_data["pmid"] = pmid
         return article_data
 
+    return _empty_article(pmid)
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
+
+async def fetch_articles_bulk(pmids: list[str]) -> list[dict[str, Any]]:
     """
-    List available tools for PubMed search and retrieval.
+    Fetch several articles with a single EFetch request.
+
+    Args:
+        pmids: List of PubMed IDs (at most EFETCH_BATCH_SIZE)
+
+    Returns:
+        Article details in input order; PMIDs PubMed did not return are omitted
+    """
+    if not pmids:
+        return []
+
+    data = {
+        "db": "pubmed",
+        "id": ",".join(pmids),
+        "retmode": "xml",
+    }
+
+    if NCBI_API_KEY:
+        data["api_key"] = NCBI_API_KEY
+
+    # POST keeps long ID lists out of the URL
+    client = get_client()
+    await rate_limiter.wait()
+    response = await client.post(EFETCH_URL, data=data, timeout=30.0)
+    response.raise_for_status()
+
+    by_pmid = {article["pmid"]: article for article in iter_pubmed_articles(response.content)}
+    return [by_pmid[pmid] for pmid in pmids if pmid in by_pmid]
+
+
+async def fetch_multiple_articles(pmids: list[str]) -> tuple[list[dict[str, Any]], list[str]]:
+    """
+    Fetch several articles in as few EFetch requests as possible.
+
+    Args:
+        pmids: List of PubMed IDs
+
+    Returns:
+        Tuple of (articles in input order, PMIDs that could not be fetched)
     """
-    return [
-        types.Tool(
-            name="search_pubmed",
-            description="Search PubMed for scientific articles. Returns a list of article PMIDs and basic information matching the search query.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'breast cancer treatment', 'PCOS polycystic ovary syndrome')",
-                    },
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum number of results to return (default: 10, max: 100)",
-                        "default": 10,
-                    },
+    # Fetch each PMID once even if the caller repeats it
+    unique_pmids = list(dict.fromkeys(pmids))
+
+    # Reuse records already fetched by get_article or an earlier batch
+    by_pmid = {}
+    for pmid in unique_pmids:
+        cached = fetch_article_abstract.cache_get(pmid)
+        if cached is not None:
+            by_pmid[pmid] = cached
+
+    missing = [pmid for pmid in unique_pmids if pmid not in by_pmid]
+    batches = [
+        missing[i:i + EFETCH_BATCH_SIZE]
+        for i in range(0, len(missing), EFETCH_BATCH_SIZE)
+    ]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch_batch(batch: list[str]) -> list[dict[str, Any]]:
+        async with semaphore:
+            return await fetch_articles_bulk(batch)
+
+    results = await asyncio.gather(
+        *(fetch_batch(batch) for batch in batches), return_exceptions=True
+    )
+
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "EFetch batch of %d PMIDs starting at %s failed (%s): %s",
+                len(batch), batch[0], type(result).__name__, result,
+            )
+            continue
+        for article in result:
+            by_pmid[article["pmid"]] = article
+            fetch_article_abstract.cache_set(article, article["pmid"])
+
+    articles = [by_pmid[pmid] for pmid in pmids if pmid in by_pmid]
+    failed = [pmid for pmid in unique_pmids if pmid not in by_pmid]
+
+    return articles, failed
+
+
+def format_article(article: dict[str, Any]) -> str:
+    """
+    Format one fetched article as markdown.
+
+    Args:
+        article: Article details as returned by fetch_article_abstract
+
+    Returns:
+        Markdown with title, metadata, keywords and abstract
+    """
+    doi = f"**DOI:** {article['doi']}\n" if article['doi'] else ""
+    authors = f"**Authors:** {', '.join(article['authors'])}\n\n" if article['authors'] else ""
+    keywords = f"**Keywords:** {', '.join(article['keywords'])}\n\n" if article['keywords'] else ""
+    if article['abstract']:
+        abstract = f"## Abstract\n\n{article['abstract']}\n"
+    else:
+        abstract = "**Note:** Abstract not available for this article.\n"
+
+    return (
+        f"# {article['title']}\n\n"
+        f"**PMID:** {article['pmid']}\n"
+        f"{doi}"
+        f"**Journal:** {article['journal']}\n"
+        f"**Published:** {article['pubdate']}\n\n"
+        f"{authors}{keywords}{abstract}"
+    )
+
+
+# Tool definitions are static, so build them once at import rather than
+# on every list_tools request
+TOOLS = [
+    types.Tool(
+        name="search_pubmed",
+        description="Search PubMed for scientific articles. Returns a list of article PMIDs and basic information matching the search query.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'breast cancer treatment', 'PCOS polycystic ovary syndrome')",
+                },
+                "max_results": {
+                    "type": "number",
+                    "description": "Maximum number of results to return (default: 10, max: 100)",
+                    "default": 10,
                 },
-                "required": ["query"],
             },
-        ),
-        types.Tool(
-            name="get_article",
-            description="Retrieve full article details including title, abstract, authors, journal, publication date, DOI, and keywords for a specific PubMed article by PMID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pmid": {
-                        "type": "string",
-                        "description": "PubMed ID (PMID) of the article to retrieve",
-                    },
+            "required": ["query"],
+        },
+    ),
+    types.Tool(
+        name="get_article",
+        description="Retrieve full article details including title, abstract, authors, journal, publication date, DOI, and keywords for a specific PubMed article by PMID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pmid": {
+                    "type": "string",
+                    "description": "PubMed ID (PMID) of the article to retrieve",
                 },
-                "required": ["pmid"],
             },
-        ),
-        types.Tool(
-            name="get_multiple_articles",
-            description="Retrieve full details for multiple PubMed articles at once. Returns abstracts, titles, authors, and metadata for all specified PMIDs.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pmids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of PubMed IDs to retrieve",
-                    },
+            "required": ["pmid"],
+        },
+    ),
+    types.Tool(
+        name="get_multiple_articles",
+        description="Retrieve full details for multiple PubMed articles at once. Returns abstracts, titles, authors, and metadata for all specified PMIDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pmids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of PubMed IDs to retrieve",
                 },
-                "required": ["pmids"],
             },
-        ),
-    ]
+            "required": ["pmids"],
+        },
+    ),
+]
+
+VALIDATORS = compile_validators(TOOLS)
 
 
-@server.call_tool()
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """
+    List available tools for PubMed search and retrieval.
+    """
+    return TOOLS
+
+
+class SearchPubmedArgs(BaseModel):
+    """Arguments for the search_pubmed tool."""
+    query: str = Field(min_length=1)
+    max_results: int = 10
+
+    @field_validator("max_results", mode="before")
+    @classmethod
+    def _clamp_max_results(cls, value: Any) -> int:
+        return min(int(value), MAX_SEARCH_RESULTS)
+
+
+class GetArticleArgs(BaseModel):
+    """Arguments for the get_article tool."""
+    pmid: str = Field(min_length=1)
+
+
+class GetMultipleArticlesArgs(BaseModel):
+    """Arguments for the get_multiple_articles tool."""
+    pmids: list[str] = Field(min_length=1)
+
+
+async def _handle_search_pubmed(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Search PubMed and list the top matching articles."""
+    args = SearchPubmedArgs.model_validate(arguments)
+    query, max_results = args.query, args.max_results
+
+    # Search PubMed
+    search_results = await search_pubmed(query, max_results)
+
+    # Get summaries for the results
+    summaries = await summarize_search(search_results)
+
+    # Format the response
+    parts = [f"Found {search_results['count']} articles for query: '{query}'\n\n"]
+    parts.append(f"Showing top {len(summaries)} results:\n\n")
+
+    for i, summary in enumerate(summaries, 1):
+        parts.append(f"{i}. **{summary['title']}**\n")
+        parts.append(f"   - PMID: {summary['pmid']}\n")
+        parts.append(f"   - Authors: {', '.join(summary['authors'][:3])}")
+        if len(summary['authors']) > 3:
+            parts.append(f" et al.")
+        parts.append(f"\n   - Journal: {summary['journal']}\n")
+        parts.append(f"   - Published: {summary['pubdate']}\n")
+        if summary['doi']:
+            parts.append(f"   - DOI: {summary['doi']}\n")
+        parts.append("\n")
+
+    parts.append("\nUse the 'get_article' tool with a PMID to retrieve the full abstract and details.")
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_get_article(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Format the full details of a single article."""
+    pmid = GetArticleArgs.model_validate(arguments).pmid
+
+    # Fetch article details
+    article = await fetch_article_abstract(pmid)
+
+    return [types.TextContent(type="text", text=format_article(article))]
+
+
+async def _handle_get_multiple_articles(arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Format the full details of several articles."""
+    pmids = GetMultipleArticlesArgs.model_validate(arguments).pmids
+
+    # Fetch all articles in batched EFetch requests
+    articles, failed = await fetch_multiple_articles(pmids)
+
+    # Format the response
+    parts = [f"Retrieved {len(articles)} articles:\n\n"]
+    parts.append("=" * 80 + "\n\n")
+
+    for article in articles:
+        parts.append(format_article(article))
+        parts.append("\n" + "=" * 80 + "\n\n")
+
+    if failed:
+        parts.append(f"**Note:** Could not retrieve PMIDs: {', '.join(failed)}\n")
+
+    return [types.TextContent(type="text", text="".join(parts))]
+
+
+# Tool name -> handler; handle_call_tool dispatches with a single lookup
+TOOL_HANDLERS = {
+    "search_pubmed": _handle_search_pubmed,
+    "get_article": _handle_get_article,
+    "get_multiple_articles": _handle_get_multiple_articles,
+}
+
+
+@server.call_tool(validate_input=False)
 async def handle_call_tool(
     name: str, arguments: dict[str, Any] | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """
     Handle tool execution requests.
     """
+    validate_arguments(VALIDATORS, name, arguments)
+
     if not arguments:
         raise ValueError("Missing arguments")
 
-    if name == "search_pubmed":
-        query = arguments.get("query")
-        if not query:
-            raise ValueError("Missing required argument: query")
-
-        max_results = min(int(arguments.get("max_results", 10)), 100)
-
-        # Search PubMed
-        search_results = await search_pubmed(query, max_results)
-
-        # Get summaries for the results
-        summaries = await get_article_summaries(search_results["pmids"])
-
-        # Format the response
-        response = f"Found {search_results['count']} articles for query: '{query}'\n\n"
-        response += f"Showing top {len(summaries)} results:\n\n"
-
-        for i, summary in enumerate(summaries, 1):
-            response += f"{i}. **{summary['title']}**\n"
-            response += f"   - PMID: {summary['pmid']}\n"
-            response += f"   - Authors: {', '.join(summary['authors'][:3])}"
-            if len(summary['authors']) > 3:
-                response += f" et al."
-            response += f"\n   - Journal: {summary['journal']}\n"
-            response += f"   - Published: {summary['pubdate']}\n"
-            if summary['doi']:
-                response += f"   - DOI: {summary['doi']}\n"
-            response += "\n"
-
-        response += "\nUse the 'get_article' tool with a PMID to retrieve the full abstract and details."
-
-        return [types.TextContent(type="text", text=response)]
-
-    elif name == "get_article":
-        pmid = arguments.get("pmid")
-        if not pmid:
-            raise ValueError("Missing required argument: pmid")
-
-        # Fetch article details
-        article = await fetch_article_abstract(pmid)
-
-        # Format the response
-        response = f"# {article['title']}\n\n"
-        response += f"**PMID:** {article['pmid']}\n"
-        if article['doi']:
-            response += f"**DOI:** {article['doi']}\n"
-        response += f"**Journal:** {article['journal']}\n"
-        response += f"**Published:** {article['pubdate']}\n\n"
-
-        if article['authors']:
-            response += f"**Authors:** {', '.join(article['authors'])}\n\n"
-
-        if article['keywords']:
-            response += f"**Keywords:** {', '.join(article['keywords'])}\n\n"
-
-        if article['abstract']:
-            response += f"## Abstract\n\n{article['abstract']}\n"
-        else:
-            response += "**Note:** Abstract not available for this article.\n"
-
-        return [types.TextContent(type="text", text=response)]
-
-    elif name == "get_multiple_articles":
-        pmids = arguments.get("pmids")
-        if not pmids:
-            raise ValueError("Missing required argument: pmids")
-
-        # Fetch all articles
-        articles = []
-        for pmid in pmids:
-            article = await fetch_article_abstract(pmid)
-            articles.append(article)
-            # Be respectful of NCBI rate limits (3 requests/second without API key)
-            if not NCBI_API_KEY:
-                await asyncio.sleep(0.34)
-
-        # Format the response
-        response = f"Retrieved {len(articles)} articles:\n\n"
-        response += "=" * 80 + "\n\n"
-
-        for article in articles:
-            response += f"# {article['title']}\n\n"
-            response += f"**PMID:** {article['pmid']}\n"
-            if article['doi']:
-                response += f"**DOI:** {article['doi']}\n"
-            response += f"**Journal:** {article['journal']}\n"
-            response += f"**Published:** {article['pubdate']}\n\n"
-
-            if article['authors']:
-                response += f"**Authors:** {', '.join(article['authors'])}\n\n"
-
-            if article['keywords']:
-                response += f"**Keywords:** {', '.join(article['keywords'])}\n\n"
-
-            if article['abstract']:
-                response += f"## Abstract\n\n{article['abstract']}\n"
-            else:
-                response += "**Note:** Abstract not available for this article.\n"
-
-            response += "\n" + "=" * 80 + "\n\n"
-
-        return [types.TextContent(type="text", text=response)]
-
-    else:
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
 
+    return await handler(arguments)
+
 
 async def main():
     """Run the PubMed MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="pubmed-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    # Connect to E-utilities while the client is still initializing
+    warmup = asyncio.create_task(preconnect(ESEARCH_URL))
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="pubmed-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        warmup.cancel()
+        await close_client()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
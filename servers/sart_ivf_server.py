@@ -7,16 +7,43 @@ SART (Society for Assisted Reproductive Technology) IVF calculator.
 """
 
 import asyncio
+import sys
+import functools
+from pathlib import Path
 from typing import Any
-import httpx
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
+# Put the project root on the path when run as a script from servers/
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.event_loop import install_uvloop
+from servers.http_client import get_client, close_client, preconnect
+from servers.validation import compile_validators, validate_arguments
+
 # SART calculator URL
 SART_URL = "https://w3.abdn.ac.uk/clsm/SARTIVF/tool/ivf1"
 
+# Optional measurements (default None) and yes/no flags (default False)
+# accepted by calculate_ivf_success, copied straight from tool arguments
+MEASUREMENT_ARGUMENTS = ("height_cm", "weight_kg", "height_ft", "height_in", "weight_lbs")
+FLAG_ARGUMENTS = (
+    "previous_full_term",
+    "male_factor",
+    "polycystic",
+    "uterine_problems",
+    "unexplained_infertility",
+    "low_ovarian_reserve",
+    "amh_available",
+)
+ARGUMENT_DEFAULTS = {
+    **dict.fromkeys(MEASUREMENT_ARGUMENTS),
+    **dict.fromkeys(FLAG_ARGUMENTS, False),
+}
+
 # Create server instance
 server = Server("sart-ivf-server")
 
@@ -99,90 +126,215 @@ async def calculate_ivf_success(
         "isMetricWeight": "true" if is_metric_weight else "false",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            SART_URL,
-            data=form_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30.0,
-            follow_redirects=True,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        # Extract cumulative probabilities (for 1, 2, and 3 cycles)
-        cumulative_probs = data.get("CumulativeProbabilityResult", [])
-
-        return {
-            "age": age,
-            "height_cm": height if is_metric else None,
-            "weight_kg": weight if is_metric_weight else None,
-            "height_ft": feet if not is_metric else None,
-            "height_in": inches if not is_metric else None,
-            "weight_lbs": pounds if not is_metric_weight else None,
-            "previous_full_term": previous_full_term,
-            "male_factor": male_factor,
-            "polycystic": polycystic,
-            "uterine_problems": uterine_problems,
-            "unexplained_infertility": unexplained_infertility,
-            "low_ovarian_reserve": low_ovarian_reserve,
-            "amh_available": amh_available,
-            "amh_value": amh_value if amh_available else None,
-            "success_rate_1_cycle": round(cumulative_probs[0], 2) if len(cumulative_probs) > 0 else None,
-            "success_rate_2_cycles": round(cumulative_probs[1], 2) if len(cumulative_probs) > 1 else None,
-            "success_rate_3_cycles": round(cumulative_probs[2], 2) if len(cumulative_probs) > 2 else None,
-            "raw_response": data,
-        }
+    client = get_client()
+    response = await client.post(
+        SART_URL,
+        data=form_data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=30.0,
+        follow_redirects=True,
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    # Extract cumulative probabilities (for 1, 2, and 3 cycles)
+    cumulative_probs = data.get("CumulativeProbabilityResult", [])
+
+    return {
+        "age": age,
+        "height_cm": height if is_metric else None,
+        "weight_kg": weight if is_metric_weight else None,
+        "height_ft": feet if not is_metric else None,
+        "height_in": inches if not is_metric else None,
+        "weight_lbs": pounds if not is_metric_weight else None,
+        "previous_full_term": previous_full_term,
+        "male_factor": male_factor,
+        "polycystic": polycystic,
+        "uterine_problems": uterine_problems,
+        "unexplained_infertility": unexplained_infertility,
+        "low_ovarian_reserve": low_ovarian_reserve,
+        "amh_available": amh_available,
+        "amh_value": amh_value if amh_available else None,
+        "success_rate_1_cycle": round(cumulative_probs[0], 2) if len(cumulative_probs) > 0 else None,
+        "success_rate_2_cycles": round(cumulative_probs[1], 2) if len(cumulative_probs) > 1 else None,
+        "success_rate_3_cycles": round(cumulative_probs[2], 2) if len(cumulative_probs) > 2 else None,
+        "raw_response": data,
+    }
 
 
 def generate_recommendations(result: dict[str, Any]) -> list[str]:
     """Generate clinical recommendations based on SART calculator results."""
-    recommendations = []
-
     success_rate = result.get("success_rate_1_cycle", 0) or 0
+    age = result.get("age", 0)
 
+    # Reduce the result to the bands the recommendations depend on
     if success_rate < 10:
+        rate_band = 0
+    elif success_rate < 20:
+        rate_band = 1
+    elif success_rate >= 40:
+        rate_band = 3
+    else:
+        rate_band = 2
+
+    if age >= 42:
+        age_band = 2
+    elif age >= 38:
+        age_band = 1
+    else:
+        age_band = 0
+
+    amh_band = 0
+    if result.get("amh_available") and result.get("amh_value"):
+        amh_value = result["amh_value"]
+        if amh_value < 1.0:
+            amh_band = 1
+        elif amh_value > 5.0:
+            amh_band = 2
+
+    return list(_recommendations_for_bands(
+        rate_band,
+        age_band,
+        amh_band,
+        bool(result.get("polycystic")),
+        bool(result.get("low_ovarian_reserve")),
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def _recommendations_for_bands(
+    rate_band: int,
+    age_band: int,
+    amh_band: int,
+    polycystic: bool,
+    low_ovarian_reserve: bool,
+) -> tuple[str, ...]:
+    """Build the recommendation list for one combination of bands (at most 144)."""
+    recommendations = []
+
+    if rate_band == 0:
         recommendations.extend([
             "Success rate is low - consider donor egg IVF",
             "Genetic counseling recommended",
             "Consider multiple cycle planning",
             "Discuss realistic expectations with fertility specialist",
         ])
-    elif success_rate < 20:
+    elif rate_band == 1:
         recommendations.extend([
             "Modified stimulation protocols may be beneficial",
             "Consider PGT-A testing",
             "Plan for potentially multiple cycles",
             "Optimize health before treatment",
         ])
-    elif success_rate >= 40:
+    elif rate_band == 3:
         recommendations.extend([
             "Good prognosis for IVF success",
             "Single embryo transfer recommended to reduce multiple pregnancy risk",
         ])
 
     # Age-specific recommendations
-    if result.get("age", 0) >= 42:
+    if age_band == 2:
         recommendations.append("Time-sensitive - expedited treatment recommended")
-    elif result.get("age", 0) >= 38:
+    elif age_band == 1:
         recommendations.append("Consider accelerated treatment timeline")
 
     # AMH-specific recommendations
-    if result.get("amh_available") and result.get("amh_value"):
-        amh_value = result["amh_value"]
-        if amh_value < 1.0:
-            recommendations.append("Low AMH - consider mini-IVF or natural cycle protocols")
-        elif amh_value > 5.0:
-            recommendations.append("High AMH - monitor for OHSS risk")
+    if amh_band == 1:
+        recommendations.append("Low AMH - consider mini-IVF or natural cycle protocols")
+    elif amh_band == 2:
+        recommendations.append("High AMH - monitor for OHSS risk")
 
     # Clinical factor recommendations
-    if result.get("polycystic"):
+    if polycystic:
         recommendations.append("PCOS - monitor for ovarian hyperstimulation syndrome")
 
-    if result.get("low_ovarian_reserve"):
+    if low_ovarian_reserve:
         recommendations.append("Low ovarian reserve - may require multiple cycles")
 
-    return recommendations
+    return tuple(recommendations)
+
+
+# Static tool definitions, returned as-is by every list_tools request
+TOOLS = [
+    types.Tool(
+        name="calculate_ivf_success",
+        description="Calculate the probability of successful IVF outcome (live birth) using the SART IVF calculator. Returns success rates for 1, 2, and 3 complete IVF cycles based on patient characteristics.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "age": {
+                    "type": "number",
+                    "description": "Patient age in years (must be 18-45)",
+                    "minimum": 18,
+                    "maximum": 45,
+                },
+                "height_cm": {
+                    "type": "number",
+                    "description": "Height in centimeters (120-220). Use this OR height_ft/height_in, not both.",
+                },
+                "weight_kg": {
+                    "type": "number",
+                    "description": "Weight in kilograms (30-160). Use this OR weight_lbs, not both.",
+                },
+                "height_ft": {
+                    "type": "number",
+                    "description": "Height in feet (4-7). Use with height_in if not using height_cm.",
+                },
+                "height_in": {
+                    "type": "number",
+                    "description": "Height in inches (0-11). Use with height_ft if not using height_cm.",
+                },
+                "weight_lbs": {
+                    "type": "number",
+                    "description": "Weight in pounds (70-350). Use if not using weight_kg.",
+                },
+                "previous_full_term": {
+                    "type": "boolean",
+                    "description": "Has the patient ever had a baby born at full term (>37 weeks)?",
+                    "default": False,
+                },
+                "male_factor": {
+                    "type": "boolean",
+                    "description": "Does the partner have a problem with their sperm?",
+                    "default": False,
+                },
+                "polycystic": {
+                    "type": "boolean",
+                    "description": "Does the patient have polycystic ovaries or PCOS?",
+                    "default": False,
+                },
+                "uterine_problems": {
+                    "type": "boolean",
+                    "description": "Does the patient have uterine problems (septum, myoma, intrauterine adhesions, congenital anomalies)?",
+                    "default": False,
+                },
+                "unexplained_infertility": {
+                    "type": "boolean",
+                    "description": "Has the patient been diagnosed with unexplained infertility?",
+                    "default": False,
+                },
+                "low_ovarian_reserve": {
+                    "type": "boolean",
+                    "description": "Has the patient been diagnosed with low ovarian reserve?",
+                    "default": False,
+                },
+                "amh_available": {
+                    "type": "boolean",
+                    "description": "Is the patient's AMH (Anti-Müllerian Hormone) level known?",
+                    "default": False,
+                },
+                "amh_value": {
+                    "type": "number",
+                    "description": "AMH level in ng/ml (only if amh_available is true)",
+                    "default": 0,
+                },
+            },
+            "required": ["age"],
+        },
+    ),
+]
+
+VALIDATORS = compile_validators(TOOLS)
 
 
 @server.list_tools()
@@ -190,93 +342,18 @@ async def handle_list_tools() -> list[types.Tool]:
     """
     List available tools for SART IVF calculator.
     """
-    return [
-        types.Tool(
-            name="calculate_ivf_success",
-            description="Calculate the probability of successful IVF outcome (live birth) using the SART IVF calculator. Returns success rates for 1, 2, and 3 complete IVF cycles based on patient characteristics.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "age": {
-                        "type": "number",
-                        "description": "Patient age in years (must be 18-45)",
-                        "minimum": 18,
-                        "maximum": 45,
-                    },
-                    "height_cm": {
-                        "type": "number",
-                        "description": "Height in centimeters (120-220). Use this OR height_ft/height_in, not both.",
-                    },
-                    "weight_kg": {
-                        "type": "number",
-                        "description": "Weight in kilograms (30-160). Use this OR weight_lbs, not both.",
-                    },
-                    "height_ft": {
-                        "type": "number",
-                        "description": "Height in feet (4-7). Use with height_in if not using height_cm.",
-                    },
-                    "height_in": {
-                        "type": "number",
-                        "description": "Height in inches (0-11). Use with height_ft if not using height_cm.",
-                    },
-                    "weight_lbs": {
-                        "type": "number",
-                        "description": "Weight in pounds (70-350). Use if not using weight_kg.",
-                    },
-                    "previous_full_term": {
-                        "type": "boolean",
-                        "description": "Has the patient ever had a baby born at full term (>37 weeks)?",
-                        "default": False,
-                    },
-                    "male_factor": {
-                        "type": "boolean",
-                        "description": "Does the partner have a problem with their sperm?",
-                        "default": False,
-                    },
-                    "polycystic": {
-                        "type": "boolean",
-                        "description": "Does the patient have polycystic ovaries or PCOS?",
-                        "default": False,
-                    },
-                    "uterine_problems": {
-                        "type": "boolean",
-                        "description": "Does the patient have uterine problems (septum, myoma, intrauterine adhesions, congenital anomalies)?",
-                        "default": False,
-                    },
-                    "unexplained_infertility": {
-                        "type": "boolean",
-                        "description": "Has the patient been diagnosed with unexplained infertility?",
-                        "default": False,
-                    },
-                    "low_ovarian_reserve": {
-                        "type": "boolean",
-                        "description": "Has the patient been diagnosed with low ovarian reserve?",
-                        "default": False,
-                    },
-                    "amh_available": {
-                        "type": "boolean",
-                        "description": "Is the patient's AMH (Anti-Müllerian Hormone) level known?",
-                        "default": False,
-                    },
-                    "amh_value": {
-                        "type": "number",
-                        "description": "AMH level in ng/ml (only if amh_available is true)",
-                        "default": 0,
-                    },
-                },
-                "required": ["age"],
-            },
-        ),
-    ]
+    return TOOLS
 
 
-@server.call_tool()
+@server.call_tool(validate_input=False)
 async def handle_call_tool(
     name: str, arguments: dict[str, Any] | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """
     Handle tool execution requests.
     """
+    validate_arguments(VALIDATORS, name, arguments)
+
     if not arguments:
         raise ValueError("Missing arguments")
 
@@ -289,62 +366,56 @@ async def handle_call_tool(
             raise ValueError("Age must be between 18 and 45")
 
         # Calculate IVF success rates
+        # Start from the defaults and copy over only the keys that were sent
+        params = ARGUMENT_DEFAULTS.copy()
+        for key in ARGUMENT_DEFAULTS.keys() & arguments.keys():
+            params[key] = arguments[key]
+
         result = await calculate_ivf_success(
             age=int(age),
-            height_cm=arguments.get("height_cm"),
-            weight_kg=arguments.get("weight_kg"),
-            height_ft=arguments.get("height_ft"),
-            height_in=arguments.get("height_in"),
-            weight_lbs=arguments.get("weight_lbs"),
-            previous_full_term=arguments.get("previous_full_term", False),
-            male_factor=arguments.get("male_factor", False),
-            polycystic=arguments.get("polycystic", False),
-            uterine_problems=arguments.get("uterine_problems", False),
-            unexplained_infertility=arguments.get("unexplained_infertility", False),
-            low_ovarian_reserve=arguments.get("low_ovarian_reserve", False),
-            amh_available=arguments.get("amh_available", False),
             amh_value=arguments.get("amh_value", 0.0),
+            **params,
         )
 
         # Format the response
-        response = "# SART IVF Success Rate Calculator Results\n\n"
-        response += "## Patient Information\n"
-        response += f"- **Age:** {result['age']} years\n"
+        parts = ["# SART IVF Success Rate Calculator Results\n\n"]
+        parts.append("## Patient Information\n")
+        parts.append(f"- **Age:** {result['age']} years\n")
 
         if result.get('height_cm'):
-            response += f"- **Height:** {result['height_cm']} cm\n"
+            parts.append(f"- **Height:** {result['height_cm']} cm\n")
         elif result.get('height_ft'):
-            response += f"- **Height:** {result['height_ft']}'{result['height_in']}\"\n"
+            parts.append(f"- **Height:** {result['height_ft']}'{result['height_in']}\"\n")
 
         if result.get('weight_kg'):
-            response += f"- **Weight:** {result['weight_kg']} kg\n"
+            parts.append(f"- **Weight:** {result['weight_kg']} kg\n")
         elif result.get('weight_lbs'):
-            response += f"- **Weight:** {result['weight_lbs']} lbs\n"
+            parts.append(f"- **Weight:** {result['weight_lbs']} lbs\n")
 
-        response += "\n## Clinical Factors\n"
-        response += f"- **Previous full-term pregnancy:** {'Yes' if result['previous_full_term'] else 'No'}\n"
-        response += f"- **Male factor infertility:** {'Yes' if result['male_factor'] else 'No'}\n"
-        response += f"- **PCOS:** {'Yes' if result['polycystic'] else 'No'}\n"
-        response += f"- **Uterine problems:** {'Yes' if result['uterine_problems'] else 'No'}\n"
-        response += f"- **Unexplained infertility:** {'Yes' if result['unexplained_infertility'] else 'No'}\n"
-        response += f"- **Low ovarian reserve:** {'Yes' if result['low_ovarian_reserve'] else 'No'}\n"
+        parts.append("\n## Clinical Factors\n")
+        parts.append(f"- **Previous full-term pregnancy:** {'Yes' if result['previous_full_term'] else 'No'}\n")
+        parts.append(f"- **Male factor infertility:** {'Yes' if result['male_factor'] else 'No'}\n")
+        parts.append(f"- **PCOS:** {'Yes' if result['polycystic'] else 'No'}\n")
+        parts.append(f"- **Uterine problems:** {'Yes' if result['uterine_problems'] else 'No'}\n")
+        parts.append(f"- **Unexplained infertility:** {'Yes' if result['unexplained_infertility'] else 'No'}\n")
+        parts.append(f"- **Low ovarian reserve:** {'Yes' if result['low_ovarian_reserve'] else 'No'}\n")
 
         if result['amh_available'] and result['amh_value'] is not None:
-            response += f"- **AMH level:** {result['amh_value']} ng/ml\n"
+            parts.append(f"- **AMH level:** {result['amh_value']} ng/ml\n")
 
-        response += "\n## Success Rates (Probability of Live Birth)\n\n"
+        parts.append("\n## Success Rates (Probability of Live Birth)\n\n")
 
         if result['success_rate_1_cycle'] is not None:
-            response += f"- **After 1 complete IVF cycle:** {result['success_rate_1_cycle']}%\n"
+            parts.append(f"- **After 1 complete IVF cycle:** {result['success_rate_1_cycle']}%\n")
         if result['success_rate_2_cycles'] is not None:
-            response += f"- **After 2 complete IVF cycles:** {result['success_rate_2_cycles']}%\n"
+            parts.append(f"- **After 2 complete IVF cycles:** {result['success_rate_2_cycles']}%\n")
         if result['success_rate_3_cycles'] is not None:
-            response += f"- **After 3 complete IVF cycles:** {result['success_rate_3_cycles']}%\n"
+            parts.append(f"- **After 3 complete IVF cycles:** {result['success_rate_3_cycles']}%\n")
 
-        response += "\n---\n"
-        response += "*Note: A complete cycle includes all embryo transfers using eggs from one ovarian stimulation cycle. These estimates are based on SART data and individual results may vary.*\n"
+        parts.append("\n---\n")
+        parts.append("*Note: A complete cycle includes all embryo transfers using eggs from one ovarian stimulation cycle. These estimates are based on SART data and individual results may vary.*\n")
 
-        return [types.TextContent(type="text", text=response)]
+        return [types.TextContent(type="text", text="".join(parts))]
 
     else:
         raise ValueError(f"Unknown tool: {name}")
@@ -352,20 +423,26 @@ async def handle_call_tool(
 
 async def main():
     """Run the SART IVF Calculator MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="sart-ivf-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    warmup = asyncio.create_task(preconnect(SART_URL))
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="sart-ivf-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        warmup.cancel()
+        await close_client()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -0,0 +1,12 @@
+"""
+HTML parsing shared by the guideline scrapers (ESHRE, ASRM, NAMS).
+
+bs4 is imported on first use rather than at module import, since it adds
+tens of milliseconds to startup and many sessions never scrape a page.
+"""
+
+
+def parse_html(html: str):
+    """Parse HTML with BeautifulSoup's built-in html.parser backend."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser')
@@ -0,0 +1,47 @@
+"""
+JSON serialization for MCP tool responses.
+
+Uses orjson when it is installed, which is several times faster than the
+standard library for the nested dicts the tools return, and falls back to
+json otherwise.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Set MCP_PRETTY_JSON=1 to indent responses, e.g. while debugging a server by hand
+PRETTY_JSON = os.getenv("MCP_PRETTY_JSON") == "1"
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None) -> str:
+    """
+    Serialize a tool response to a JSON string.
+
+    Responses are read by the model rather than a person, so they are
+    compact by default; indentation only adds bytes to the stdio stream.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent with two spaces for human-readable output
+            (defaults to the MCP_PRETTY_JSON environment setting)
+
+    Returns:
+        JSON text
+    """
+    if pretty is None:
+        pretty = PRETTY_JSON
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
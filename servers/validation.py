@@ -0,0 +1,52 @@
+"""
+Tool argument validation for the low-level MCP servers.
+
+The MCP server validates every call with jsonschema.validate(), which
+re-checks the schema and builds a fresh validator each time. The tool
+schemas are static, so the servers compile one validator per tool at
+import and register their call_tool handlers with validate_input=False.
+"""
+
+from typing import Any, Iterable, Optional
+
+import jsonschema
+import mcp.types as types
+
+
+def compile_validators(tools: Iterable[types.Tool]) -> dict[str, Any]:
+    """
+    Build a validator for each tool's inputSchema.
+
+    Args:
+        tools: Tool definitions served by list_tools
+
+    Returns:
+        Dict mapping tool name to its compiled validator
+    """
+    validators = {}
+    for tool in tools:
+        cls = jsonschema.validators.validator_for(tool.inputSchema)
+        cls.check_schema(tool.inputSchema)
+        validators[tool.name] = cls(tool.inputSchema)
+    return validators
+
+
+def validate_arguments(
+    validators: dict[str, Any], name: str, arguments: Optional[dict[str, Any]]
+) -> None:
+    """
+    Check tool arguments against the precompiled schema.
+
+    Unknown tools are left for the handler to report. The error message
+    matches the one the MCP server produces with validate_input=True.
+
+    Raises:
+        ValueError: If the arguments do not match the tool's inputSchema
+    """
+    validator = validators.get(name)
+    if validator is None:
+        return
+
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments or {}))
+    if error is not None:
+        raise ValueError(f"Input validation error: {error.message}")
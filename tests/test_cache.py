@@ -0,0 +1,115 @@
+"""
+Test the async LRU cache used by the research servers (servers/cache.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers import cache
+from servers.cache import async_lru_cache
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+def make_counter(**cache_kwargs):
+    """A cached coroutine that records every real call."""
+    calls = []
+
+    @async_lru_cache(**cache_kwargs)
+    async def fetch(key):
+        calls.append(key)
+        return f"value-{key}-{len(calls)}"
+
+    return fetch, calls
+
+
+def test_repeated_calls_are_served_from_cache():
+    """Test that the same arguments only reach the wrapped function once."""
+    fetch, calls = make_counter()
+
+    first = asyncio.run(fetch("a"))
+    second = asyncio.run(fetch("a"))
+
+    assert first == second
+    assert calls == ["a"]
+
+
+def test_entries_expire_after_ttl(clock):
+    """Test that an entry is refetched once its TTL has passed."""
+    fetch, calls = make_counter(ttl=60)
+
+    asyncio.run(fetch("a"))
+    clock.now += 59
+    asyncio.run(fetch("a"))
+    assert calls == ["a"], "Entry should still be valid before the TTL"
+
+    clock.now += 2
+    asyncio.run(fetch("a"))
+    assert calls == ["a", "a"], "Entry should be refetched after the TTL"
+
+
+def test_exceptions_are_not_cached():
+    """Test that a failing call is retried instead of caching the error."""
+    attempts = []
+
+    @async_lru_cache()
+    async def flaky(key):
+        attempts.append(key)
+        if len(attempts) == 1:
+            raise RuntimeError("upstream down")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(flaky("a"))
+
+    assert asyncio.run(flaky("a")) == "ok"
+    assert asyncio.run(flaky("a")) == "ok"
+    assert attempts == ["a", "a"]
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that maxsize evicts the entry used longest ago."""
+    fetch, calls = make_counter(maxsize=2)
+
+    asyncio.run(fetch("a"))
+    asyncio.run(fetch("b"))
+    asyncio.run(fetch("a"))  # "a" is now the most recently used
+    asyncio.run(fetch("c"))  # evicts "b"
+
+    asyncio.run(fetch("a"))
+    asyncio.run(fetch("b"))
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_cache_get_and_set_share_the_wrapped_cache(clock):
+    """Test that results stored with cache_set are served by the wrapper."""
+    fetch, calls = make_counter(ttl=60)
+
+    assert fetch.cache_get("a") is None
+    fetch.cache_set("bulk-a", "a")
+    assert fetch.cache_get("a") == "bulk-a"
+    assert asyncio.run(fetch("a")) == "bulk-a"
+    assert calls == []
+
+    clock.now += 61
+    assert fetch.cache_get("a") is None, "cache_set entries expire like any other"
@@ -236,4 +236,83 @@ class TestCalculatorServer:
         
         assert result.returncode == 0, f"Server inspection failed: {result.stderr}"
         assert "Tools:" in result.stdout, "Server should have tools"
-        assert "women-health-calculator" in result.stdout, "Server should have correct name"
\ No newline at end of file
+        assert "women-health-calculator" in result.stdout, "Server should have correct name"
+
+
+class TestPatientInput:
+
+    def test_accepts_in_range_input(self):
+        """Test that valid patient parameters pass through to_params."""
+        from mcp_servers.calculator_server import PatientInput
+
+        patient = PatientInput(age=32, amh_value=2.5, height_cm=165, weight_kg=65)
+        params = patient.to_params()
+        assert params["age"] == 32
+        assert "height_ft" not in params, "Unset measurements should be left out"
+
+    @pytest.mark.parametrize("overrides", [
+        {"age": -1},
+        {"age": 60},
+        {"weight_kg": 500},
+        {"height_cm": 20},
+    ])
+    def test_rejects_out_of_range_input(self, overrides):
+        """Test that out-of-range patient parameters raise ValueError."""
+        from mcp_servers.calculator_server import PatientInput
+
+        values = {"age": 32, "amh_value": 2.5, **overrides}
+        with pytest.raises(ValueError):
+            PatientInput(**values)
+
+    def test_accepts_high_amh(self):
+        """Test that AMH is not bounded, since PCOS values can be very high."""
+        from mcp_servers.calculator_server import PatientInput
+
+        assert PatientInput(age=32, amh_value=60.0).to_params()["amh_value"] == 60.0
+
+
+class TestPredictIvfSuccessBmi:
+    """predict_ivf_success turns a BMI-only input into an estimated weight."""
+
+    @pytest.fixture
+    def calculator(self, monkeypatch):
+        """Calculator module with the SART API call replaced by a recorder."""
+        from mcp_servers import calculator_server
+
+        calls = []
+
+        async def fake_calculate(**params):
+            calls.append(params)
+            return {
+                **dict.fromkeys(["height_cm", "height_ft", "height_in", "weight_lbs"]),
+                **params,
+                "success_rate_1_cycle": 40.0,
+                "success_rate_2_cycles": 55.0,
+                "success_rate_3_cycles": 62.0,
+            }
+
+        monkeypatch.setattr(calculator_server.sart_ivf_server, "calculate_ivf_success", fake_calculate)
+        monkeypatch.setattr(calculator_server.sart_ivf_server, "generate_recommendations", lambda result: [])
+        # FastMCP wraps tools; the undecorated coroutine is kept on .fn
+        predict = getattr(calculator_server.predict_ivf_success, "fn", calculator_server.predict_ivf_success)
+        return predict, calls
+
+    @pytest.mark.asyncio
+    async def test_bmi_only_derives_weight(self, calculator):
+        """Test that a BMI-only input is sent as weight_kg at the assumed height."""
+        predict, calls = calculator
+
+        result = json.loads(await predict(age=32, amh=2.5, bmi=24.0))
+
+        assert "error" not in result
+        assert calls[0]["weight_kg"] == pytest.approx(24.0 * 1.65 ** 2)
+
+    @pytest.mark.asyncio
+    async def test_bmi_only_out_of_range_is_rejected(self, calculator):
+        """Test that an impossible BMI is reported as an error without calling SART."""
+        predict, calls = calculator
+
+        result = json.loads(await predict(age=32, amh=2.5, bmi=80.0))
+
+        assert "weight_kg" in result["error"]
+        assert calls == [], "SART should not be called for rejected input"
@@ -0,0 +1,50 @@
+"""
+Test the ELSA data module search (servers/elsa_server.py)
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.elsa_server import _compile_query, search_modules
+
+
+def module_ids(results):
+    return [result["module_id"] for result in results]
+
+
+def test_single_term_match():
+    """Test that one term finds the module naming it."""
+    assert module_ids(search_modules("loneliness")) == ["social"]
+
+
+def test_multi_term_query_matches_any_term():
+    """Test that a module matches if any one of the query terms appears in it."""
+    results = search_modules("depression loneliness")
+
+    assert module_ids(results) == ["mental_health", "social"]
+    variables = {result["module_id"]: result["relevant_variables"] for result in results}
+    assert variables["mental_health"] == ["Depression (CES-D)"]
+    assert variables["social"] == ["Loneliness"]
+
+
+def test_module_filter_restricts_search():
+    """Test that module limits the search to that one module."""
+    assert module_ids(search_modules("depression loneliness", module="social")) == ["social"]
+    assert search_modules("depression", module="social") == []
+
+
+def test_regex_metacharacters_are_literal():
+    """Test that query terms are matched as plain text, not as regex syntax."""
+    assert module_ids(search_modules("(ces-d)")) == ["mental_health"]
+    assert search_modules(".*") == []
+
+
+def test_compile_query_alternates_terms():
+    """Test that the compiled pattern matches each term on bytes."""
+    pattern = _compile_query("pain sleep")
+
+    assert pattern.search(b"chronic pain")
+    assert pattern.search(b"sleep quality")
+    assert not pattern.search(b"income")
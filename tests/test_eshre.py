@@ -10,6 +10,11 @@ This script tests the functionality of the ESHRE server by:
 
 import asyncio
 import sys
+
+import httpx
+import pytest
+
+from servers import eshre_server
 from servers.eshre_server import (
     parse_guidelines_list,
     search_guidelines,
@@ -113,6 +118,38 @@ async def test_get_guideline_content():
         return False
 
 
+@pytest.mark.asyncio
+async def test_call_tool_unknown_tool_raises():
+    """Test that an unknown tool is an MCP error rather than tool output."""
+    with pytest.raises(ValueError, match="Unknown tool: not_a_tool"):
+        await eshre_server.handle_call_tool("not_a_tool", {})
+
+
+@pytest.mark.asyncio
+async def test_call_tool_reports_http_errors_with_type(monkeypatch):
+    """Test that upstream HTTP failures come back as tagged tool output."""
+    async def failing_handler(arguments):
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setitem(eshre_server.TOOL_HANDLERS, "list_eshre_guidelines", failing_handler)
+
+    result = await eshre_server.handle_call_tool("list_eshre_guidelines", {})
+
+    assert result[0].text == "Error executing list_eshre_guidelines (ConnectError): connection refused"
+
+
+@pytest.mark.asyncio
+async def test_call_tool_propagates_unexpected_errors(monkeypatch):
+    """Test that errors outside the reported set (e.g. a changed page layout) propagate."""
+    async def broken_handler(arguments):
+        raise AttributeError("'NoneType' object has no attribute 'find_all'")
+
+    monkeypatch.setitem(eshre_server.TOOL_HANDLERS, "list_eshre_guidelines", broken_handler)
+
+    with pytest.raises(AttributeError):
+        await eshre_server.handle_call_tool("list_eshre_guidelines", {})
+
+
 async def main():
     """Run all tests."""
     print("\n" + "="*80)
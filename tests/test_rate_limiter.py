@@ -0,0 +1,46 @@
+"""
+Test the PubMed request rate limiter (servers/pubmed_server.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.pubmed_server import RateLimiter
+
+# Slack for the event loop waking a task slightly after its slot
+TOLERANCE = 0.01
+
+
+def record_start_times(rate, callers):
+    """Run `callers` concurrent wait() calls and return when each one was let through."""
+    async def run():
+        limiter = RateLimiter(rate)
+        loop = asyncio.get_running_loop()
+        begin = loop.time()
+
+        async def caller():
+            await limiter.wait()
+            return loop.time() - begin
+
+        return await asyncio.gather(*(caller() for _ in range(callers)))
+
+    return sorted(asyncio.run(run()))
+
+
+def test_first_request_is_not_delayed():
+    """Test that an idle limiter lets the first caller through immediately."""
+    starts = record_start_times(rate=10, callers=1)
+    assert starts[0] < TOLERANCE
+
+
+def test_concurrent_callers_are_spaced_by_the_interval():
+    """Test that concurrent wait() calls each get their own slot."""
+    rate = 20
+    starts = record_start_times(rate=rate, callers=5)
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 1 / rate - TOLERANCE for gap in gaps), f"Requests too close together: {gaps}"
+    assert starts[-1] < 4 / rate + 0.1, "Slots should follow each other without extra delay"
@@ -0,0 +1,69 @@
+"""
+Test the precompiled tool argument validators (servers/validation.py)
+"""
+import sys
+from pathlib import Path
+
+import jsonschema
+import mcp.types as types
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.validation import compile_validators, validate_arguments
+
+
+TOOL = types.Tool(
+    name="search",
+    description="Search test tool",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {"type": "string"},
+            "max_results": {"type": "number", "minimum": 1},
+        },
+        "required": ["query"],
+    },
+)
+
+
+@pytest.fixture
+def validators():
+    return compile_validators([TOOL])
+
+
+def test_valid_arguments_pass(validators):
+    """Test that matching arguments are accepted."""
+    validate_arguments(validators, "search", {"query": "pcos", "max_results": 5})
+
+
+@pytest.mark.parametrize("arguments", [
+    {},
+    None,
+    {"query": 42},
+    {"query": "pcos", "max_results": 0},
+])
+def test_invalid_arguments_raise_input_validation_error(validators, arguments):
+    """Test that bad payloads raise the same message as the MCP server's own check."""
+    with pytest.raises(ValueError, match=r"^Input validation error: "):
+        validate_arguments(validators, "search", arguments)
+
+
+def test_missing_required_message(validators):
+    """Test the full message for a missing required argument."""
+    with pytest.raises(ValueError) as exc_info:
+        validate_arguments(validators, "search", {})
+    assert str(exc_info.value) == "Input validation error: 'query' is a required property"
+
+
+def test_unknown_tool_is_left_to_the_handler(validators):
+    """Test that a tool without a validator is not rejected here."""
+    validate_arguments(validators, "not_a_tool", {"anything": 1})
+
+
+def test_invalid_schema_is_rejected_at_compile_time():
+    """Test that a broken inputSchema fails when the validators are built."""
+    broken = types.Tool(name="broken", description="", inputSchema={"type": "not-a-type"})
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        compile_validators([broken])